@@ -10,7 +10,7 @@ from typing import TYPE_CHECKING
 
 import click
 from dotenv import load_dotenv
-from packaging.version import Version
+from packaging.version import InvalidVersion, Version
 from packaging.version import parse as parse_version
 
 from bento_mdb_updates.clients import GitHubClient
@@ -23,6 +23,8 @@ if TYPE_CHECKING:
 load_dotenv(Path("config/.env"))
 logger = logging.getLogger(__name__)
 
+SEMVER_PATTERN = re.compile(r"(\d+\.\d+\.\d+)")
+
 
 def normalize_tag_version(tag: str) -> str:
     """
@@ -30,7 +32,7 @@ def normalize_tag_version(tag: str) -> str:
 
     Returns an tag as-is if no valid semantic version is found.
     """
-    match = re.search(r"(\d+\.\d+\.\d+)", tag)
+    match = SEMVER_PATTERN.search(tag)
     if match:
         return match.group(1)
     logger.warning("No semantic version found in tag %s", tag)
@@ -45,13 +47,23 @@ def update_model_versions(
 ) -> bool:
     """Update ModelSpec with missing version tags and prerelease commits from GitHub."""
     updated = False
+    repo_tags = github_client.get_repo_tags_batch(
+        [spec["repository"] for spec in model_specs.values() if spec.get("repository")],
+    )
+    prerelease_info = github_client.get_prerelease_model_info_batch(
+        [
+            model
+            for model, spec in model_specs.items()
+            if spec.get("repository") and spec["in_data_hub"]
+        ],
+    )
     for model, spec in model_specs.items():
         logger.info("Checking %s for new tags...", model)
         repo = spec.get("repository")
         if not repo:
             logger.warning("No repository specified for %s", model)
             continue
-        raw_tags = github_client.get_repo_tags(repo)
+        raw_tags = repo_tags[repo]
         current_versions = spec.get("versions", [])
 
         nonignored_versions = [
@@ -63,7 +75,11 @@ def update_model_versions(
         if raw_tags:
             for tag in raw_tags:
                 normalized_tag = normalize_tag_version(tag)
-                tag_version = Version(normalized_tag)
+                try:
+                    tag_version = Version(normalized_tag)
+                except InvalidVersion:
+                    logger.warning("Skipping tag %s with invalid version", tag)
+                    continue
 
                 if any(
                     v.get("tag") == tag and v.get("ignore", False)
@@ -106,7 +122,7 @@ def update_model_versions(
         if not spec["in_data_hub"]:
             continue
         logger.info("Checking %s for new prerelease commits...", model)
-        new_prerelease_info = github_client.get_prerelease_model_info(model)
+        new_prerelease_info = prerelease_info[model]
         if not new_prerelease_info:
             logger.info("No prerelease commits found for %s", model)
             continue
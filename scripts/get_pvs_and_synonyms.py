@@ -14,7 +14,7 @@ from bento_mdb_updates.model_cdes import (
     add_cde_pvs_to_model_cde_spec,
     add_ncit_synonyms_to_model_cde_spec,
     count_model_cdes,
-    dump_to_yaml,
+    dump_model_cde_spec_to_json,
     make_model_cde_spec,
 )
 
@@ -46,10 +46,34 @@ logger = logging.getLogger(__name__)
     multiple=True,
     help="path or URL to MDF YAML file(s)",
 )
-def main(model_handle: str, model_version: str, mdf_files: str | list[str]) -> None:
+@click.option(
+    "-c",
+    "--cadsr_cache",
+    required=False,
+    type=click.Path(path_type=Path),
+    help="JSON file to cache caDSR value sets between runs",
+)
+@click.option(
+    "--cadsr_cache_ttl",
+    required=False,
+    type=float,
+    default=0,
+    show_default=True,
+    help="seconds a cached caDSR value set is reused without revalidation",
+)
+def main(
+    model_handle: str,
+    model_version: str,
+    mdf_files: str | list[str],
+    cadsr_cache: Path | None,
+    cadsr_cache_ttl: float,
+) -> None:
     """Do stuff."""
     ncit_client = NCItClient()
-    cadsr_client = CADSRClient()
+    cadsr_client = CADSRClient(
+        cache_file=cadsr_cache,
+        cache_ttl=cadsr_cache_ttl,
+    )
 
     # get CDEs from model files
     logger.info("Getting CDEs from %s v%s MDFs...", model_handle, model_version)
@@ -59,15 +83,16 @@ def main(model_handle: str, model_version: str, mdf_files: str | list[str]) -> N
     model_cde_spec = make_model_cde_spec(model)
 
     add_cde_pvs_to_model_cde_spec(model_cde_spec, cadsr_client)
+    cadsr_client.save_valueset_cache()
     add_ncit_synonyms_to_model_cde_spec(model_cde_spec, ncit_client)
 
-    # save cde spec to yaml
+    # save cde spec to json
     output_dir = Path().cwd() / "data/output/model_cde_pvs"
-    model_cdes_yml = (
-        output_dir / model_handle / f"{model_handle}_{model_version}_cdes.yml"
+    model_cdes_json = (
+        output_dir / model_handle / f"{model_handle}_{model_version}_cdes.json"
     )
 
-    dump_to_yaml(model_cde_spec, model_cdes_yml)
+    dump_model_cde_spec_to_json(model_cde_spec, model_cdes_json)
 
 
 if __name__ == "__main__":
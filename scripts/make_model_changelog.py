@@ -79,6 +79,28 @@ logger = logging.getLogger(__name__)
     type=bool,
     help="Is this the latest data model version?",
 )
+@click.option(
+    "-b",
+    "--batch_size",
+    required=False,
+    type=int,
+    help="Create entities with UNWIND statements of up to this many entities",
+)
+@click.option(
+    "-i",
+    "--iterate_batch_size",
+    required=False,
+    type=int,
+    help="With --batch_size, run batches via apoc.periodic.iterate in this size",
+)
+@click.option(
+    "-s",
+    "--statements_per_changeset",
+    required=False,
+    type=int,
+    default=1,
+    help="Number of cypher statements to group into each changeset",
+)
 def main(  # noqa: PLR0913
     model_handle: str,
     mdf_files: str | list[str],
@@ -86,6 +108,9 @@ def main(  # noqa: PLR0913
     author: str,
     _commit: str | None,
     model_version: str | None,
+    batch_size: int | None,
+    iterate_batch_size: int | None,
+    statements_per_changeset: int,
     *,
     add_rollback: bool,
     latest_version: bool,
@@ -102,6 +127,9 @@ def main(  # noqa: PLR0913
     converter = ModelToChangelogConverter(
         model=mdf.model,
         add_rollback=add_rollback,
+        batch_size=batch_size,
+        iterate_batch_size=iterate_batch_size,
+        statements_per_changeset=statements_per_changeset,
     )
     changelog = converter.convert_model_to_changelog(
         author,
@@ -93,12 +93,11 @@ def convert_annotation_to_changesets(
     # create changesets for each statement
     cs_id = changeset_id
     for stmt in statements:
-        str_stmt = str(stmt).replace("\\'", "'")
         changesets.append(
             Changeset(
                 id=str(cs_id),
                 author=author,
-                change_type=CypherChange(text=str_stmt),
+                change_type=CypherChange(text=str(stmt)),
             ),
         )
         cs_id += 1
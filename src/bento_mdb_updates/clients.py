@@ -2,39 +2,101 @@
 
 from __future__ import annotations
 
+import copy
 import csv
 import datetime
+import hashlib
 import io
 import logging
+import operator
 import os
+import pickle
 import re
+import shutil
 import subprocess
+import sys
+import tempfile
+import threading
+import time
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from json import JSONDecodeError
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+import orjson
 import requests
-import stamina
 import yaml
+from requests.adapters import HTTPAdapter
 from tqdm import tqdm
+from tqdm.contrib.concurrent import thread_map
+from urllib3.util.retry import Retry
 
 from bento_mdb_updates.constants import NCIM_TSV_NAME
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader
+
 if TYPE_CHECKING:
     from bento_mdb_updates.datatypes import AnnotationSpec, MDBCDESpec, PermissibleValue
 
 
 RESPONSE_200 = 200
+RESPONSE_304 = 304
 DEFAULT_TIMEOUT = 120
 DEFAULT_RETRIES = 3
 DEFAULT_RETRY_DELAY = 1.0
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+DEFAULT_MAX_WORKERS = 8
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+ZIP_SPOOL_MAX_SIZE = 64 << 20  # larger downloads spill to disk
+GITHUB_PER_PAGE = 100
+TQDM_MININTERVAL = 0.5  # seconds between progress bar refreshes
 
 SYNC_STATUS_YAML = Path("config/sync_status.yml")
+_SYNC_STATUS_CACHE: dict[Path, tuple[tuple[int, int, int], dict]] = {}
+_SYNC_STATUS_LOCK = threading.Lock()
+
+NCI_SYNONYM_SOURCES = frozenset({"NCIt", "NCIm"})
+CDE_VERSION_PATTERN = re.compile(r"^v?\d{1,3}(\.\d{1,3}){0,2}$")
+NCIM_README_VERSION_PATTERN = re.compile(r"NCIm version:\s*(\d{6})")
+
+# NCIm TSV columns used: NCIt code, source code, source term, source, source version
+NCIM_TSV_COLUMNS = operator.itemgetter(2, 4, 5, 6, 7)
+NCIM_TSV_MIN_FIELDS = 8
+# NCIm synonyms always carry all four fields; same order as get_synonym_key
+NCIM_SYNONYM_KEY = operator.itemgetter(
+    "origin_id",
+    "origin_name",
+    "origin_version",
+    "value",
+)
+NCIM_CACHE_SUFFIX = ".pkl"
+# bump when the cached NCIm mapping layout changes so older caches are rebuilt
+NCIM_CACHE_VERSION = 1
+# long NCIm synonym values must not trip csv's default 128 KiB field limit;
+# bounded so it fits a C long on every platform
+CSV_FIELD_SIZE_LIMIT = 2**31 - 1
+csv.field_size_limit(CSV_FIELD_SIZE_LIMIT)
 
 logger = logging.getLogger(__name__)
 
 
+def load_sync_status(yaml_path: Path) -> dict:
+    """Load sync_status.yml, reparsing only when the file has changed."""
+    stat = yaml_path.stat()
+    signature = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+    with _SYNC_STATUS_LOCK:
+        cached = _SYNC_STATUS_CACHE.get(yaml_path)
+        if cached and cached[0] == signature:
+            return cached[1]
+        sync_status = yaml.load(yaml_path.read_bytes(), Loader=SafeLoader)
+        _SYNC_STATUS_CACHE[yaml_path] = (signature, sync_status)
+    return sync_status
+
+
 def get_last_sync_date(
     source: str,
     yaml_path: Path = SYNC_STATUS_YAML,
@@ -43,19 +105,102 @@ def get_last_sync_date(
     if not yaml_path.exists():
         msg = f"File {yaml_path} does not exist."
         raise FileNotFoundError(msg)
-    with yaml_path.open(mode="r", encoding="utf-8") as f:
-        sync_status = yaml.safe_load(f)
+    sync_status = load_sync_status(yaml_path)
     return datetime.datetime.strptime(
         sync_status[source]["last_updated"],
         sync_status[source]["date_format"],
     ).replace(tzinfo=datetime.UTC)
 
 
+def get_synonym_key(syn: dict) -> tuple[str | None, ...]:
+    """Get hashable key identifying a synonym by its origin and value."""
+    return (
+        syn.get("origin_id"),
+        syn.get("origin_name"),
+        syn.get("origin_version"),
+        syn.get("value"),
+    )
+
+
+def make_cde_annotation_spec(
+    cde_spec: MDBCDESpec,
+    value_set: list[PermissibleValue],
+) -> AnnotationSpec:
+    """Make AnnotationSpec for an MDB CDE with PVs to add."""
+    return {
+        "entity": {},
+        "annotation": {
+            "key": (cde_spec["CDEFullName"], cde_spec["CDEOrigin"]),
+            "attrs": {
+                "origin_id": cde_spec["CDECode"],
+                "origin_version": cde_spec.get("CDEVersion"),
+                "origin_name": cde_spec["CDEOrigin"],
+                "value": cde_spec["CDEFullName"],
+            },
+        },
+        "value_set": value_set,
+    }
+
+
+def get_annotation_spec_hash(annotation_spec: AnnotationSpec) -> str:
+    """Get stable SHA-256 hash of an AnnotationSpec's annotation and value set."""
+    return hashlib.sha256(
+        orjson.dumps(
+            [annotation_spec["annotation"], annotation_spec["value_set"]],
+            option=orjson.OPT_SORT_KEYS,
+        ),
+    ).hexdigest()
+
+
 class CADSRClient:
     """Client for caDSR II API."""
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        cache_file: Path | None = None,
+        cache_ttl: float = 0,
+    ) -> None:
         """Initialize client."""
+        self.cache_file = cache_file
+        # cached value sets younger than cache_ttl seconds are served without HTTP
+        self.cache_ttl = cache_ttl
+        self.valueset_cache: dict[str, dict] = self.load_valueset_cache()
+        retry = Retry(
+            total=DEFAULT_RETRIES,
+            backoff_factor=DEFAULT_RETRY_DELAY,
+            status_forcelist=RETRY_STATUS_CODES,
+            allowed_methods=frozenset({"GET"}),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        self.session = requests.Session()
+        self.session.headers.update({"accept": "application/json"})
+        # pool capped at worker count so concurrent callers can't flood caDSR
+        self.session.mount(
+            "https://",
+            HTTPAdapter(
+                max_retries=retry,
+                pool_maxsize=DEFAULT_MAX_WORKERS,
+                pool_block=True,
+            ),
+        )
+
+    def load_valueset_cache(self) -> dict[str, dict]:
+        """Load cached value sets and their ETag/Last-Modified headers by URL."""
+        if not self.cache_file or not self.cache_file.exists():
+            return {}
+        try:
+            return orjson.loads(self.cache_file.read_bytes())
+        except (OSError, JSONDecodeError):
+            logger.warning("Ignoring unreadable caDSR cache %s", self.cache_file)
+            return {}
+
+    def save_valueset_cache(self) -> None:
+        """Save cached value sets to self.cache_file."""
+        if not self.cache_file:
+            return
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        self.cache_file.write_bytes(orjson.dumps(self.valueset_cache))
 
     def get_valueset_from_json(
         self,
@@ -76,37 +221,43 @@ class CADSRClient:
                 )
                 return vs
             for pv in cde_pvs:
+                vm = pv["ValueMeaning"]
+                vm_concepts = vm.get("Concepts", [])
+                nci_concepts = [
+                    concept
+                    for concept in vm_concepts
+                    if concept.get("evsSource") == "NCI_CONCEPT_CODE"
+                ]
+                # ambiguous mapping: keep the codes but don't guess synonyms
+                multiple_concepts = len(nci_concepts) > 1
+                if multiple_concepts:
+                    logger.warning(
+                        "Multiple NCIt concepts found for PV %s: %sv%s",
+                        pv["value"],
+                        vm["publicId"],
+                        vm["version"],
+                    )
                 pv_dict = {
                     "value": pv["value"],
-                    "origin_version": pv["ValueMeaning"]["version"],
-                    "origin_id": pv["ValueMeaning"]["publicId"],
-                    "origin_definition": pv["ValueMeaning"]["definition"],
+                    "origin_version": vm["version"],
+                    "origin_id": vm["publicId"],
+                    "origin_definition": vm["definition"],
                     "origin_name": "caDSR",
-                    "ncit_concept_codes": [],
-                    "synonyms": [],
-                }
-                vm_concepts = pv["ValueMeaning"].get("Concepts", [])
-                for concept in vm_concepts:
-                    if concept.get("evsSource") != "NCI_CONCEPT_CODE":
-                        continue
-                    pv_dict["ncit_concept_codes"].append(concept["conceptCode"])
-                    if len(vm_concepts) > 1:
-                        msg = "Multiple NCIt concepts found for PV %s: %sv%s"
-                        logger.warning(
-                            msg,
-                            pv["value"],
-                            pv["ValueMeaning"]["publicId"],
-                            pv["ValueMeaning"]["version"],
-                        )
-                        continue  # TODO: break out of concepts loop?
-                    pv_dict["synonyms"].append(
+                    "ncit_concept_codes": [
+                        concept["conceptCode"] for concept in nci_concepts
+                    ],
+                    "synonyms": []
+                    if multiple_concepts
+                    else [
                         {
                             "value": concept["longName"],
                             "origin_id": concept["conceptCode"],
                             "origin_definition": concept["definition"],
                             "origin_name": "NCIt",
-                        },
-                    )
+                        }
+                        for concept in nci_concepts
+                    ],
+                }
                 vs.append(pv_dict)
         except Exception as e:
             msg = f"Exception occurred when getting value set from JSON: {e}"
@@ -115,7 +266,6 @@ class CADSRClient:
         else:
             return vs
 
-    @stamina.retry(on=requests.RequestException, attempts=DEFAULT_RETRIES)
     def fetch_cde_valueset(
         self,
         cde_id: str,
@@ -125,18 +275,36 @@ class CADSRClient:
         """Fetch CDE value set from caDSR II API."""
         ver_str = (
             f"?version={cde_version}"
-            if cde_version and re.match(r"^v?\d{1,3}(\.\d{1,3}){0,2}$", cde_version)
+            if cde_version and CDE_VERSION_PATTERN.match(cde_version)
             else ""
         )
         cde_id_ver_str = f"{cde_id}{ver_str}"
         url = f"https://cadsrapi.cancer.gov/rad/NCIAPI/1.0/api/DataElement/{cde_id_ver_str}"
-        headers = {"accept": "application/json"}
+        headers = {}
+        cached = self.valueset_cache.get(url)
+        if cached and self.is_cache_fresh(cached):
+            logger.debug("Using cached caDSR value set for %s", url)
+            return copy.deepcopy(cached["value_set"])
+        if cached:
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
 
         try:
-            response = requests.get(url, timeout=DEFAULT_TIMEOUT, headers=headers)
+            response = self.session.get(
+                url,
+                timeout=DEFAULT_TIMEOUT,
+                headers=headers,
+            )
+            if cached and response.status_code == RESPONSE_304:
+                logger.debug("caDSR value set unchanged for %s", url)
+                cached["fetched_at"] = time.time()
+                return copy.deepcopy(cached["value_set"])
             response.raise_for_status()
-            json_response = response.json()
+            json_response = orjson.loads(response.content)
             value_set = self.get_valueset_from_json(json_response)
+            self.cache_valueset(url, response, value_set)
         except JSONDecodeError as e:
             msg = (
                 f"Failed to parse JSON response for entity{entity_key}: {e}\nurl: {url}"
@@ -153,38 +321,61 @@ class CADSRClient:
         else:
             return value_set
 
+    def cache_valueset(
+        self,
+        url: str,
+        response: requests.Response,
+        value_set: list[PermissibleValue | None],
+    ) -> None:
+        """Cache value set for url if caching is on and response is cacheable."""
+        if not self.cache_file:
+            return
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if not etag and not last_modified and not self.cache_ttl:
+            return
+        self.valueset_cache[url] = {
+            "etag": etag,
+            "last_modified": last_modified,
+            "fetched_at": time.time(),
+            "value_set": copy.deepcopy(value_set),
+        }
+
+    def is_cache_fresh(self, cached: dict) -> bool:
+        """Check if cached value set was fetched within self.cache_ttl seconds."""
+        if not self.cache_ttl:
+            return False
+        fetched_at = cached.get("fetched_at")
+        return fetched_at is not None and time.time() - fetched_at < self.cache_ttl
+
     def check_cdes_against_mdb(
         self,
         mdb_cdes: list[MDBCDESpec],
     ) -> list[AnnotationSpec]:
         """For MDB CDEs with PVs, check caDSR for new PVs."""
         result = []
-        for cde_spec in tqdm(mdb_cdes, desc="Checking caDSR for new PVs..."):
-            mdb_pvs = [pv["value"] for pv in cde_spec["permissibleValues"]]
-            cadsr_pvs = self.fetch_cde_valueset(
+        seen_hashes: set[str] = set()
+        # fetches overlap across threads; progress tracks completed fetches
+        fetched_pvs = thread_map(
+            lambda cde_spec: self.fetch_cde_valueset(
                 cde_id=cde_spec["CDECode"],
                 cde_version=cde_spec.get("CDEVersion"),
-            )
+            ),
+            mdb_cdes,
+            max_workers=DEFAULT_MAX_WORKERS,
+            desc="Checking caDSR for new PVs...",
+            mininterval=TQDM_MININTERVAL,
+            disable=None,
+        )
+        for cde_spec, cadsr_pvs in zip(mdb_cdes, fetched_pvs, strict=True):
+            mdb_pvs = {pv["value"] for pv in cde_spec["permissibleValues"]}
             if not cadsr_pvs:
                 logger.exception(
                     "Error fetching PVs from caDSR for %sv%s",
                     cde_spec["CDECode"],
                     cde_spec.get("CDEVersion"),
                 )
-            annotation_spec: AnnotationSpec = {
-                "entity": {},
-                "annotation": {
-                    "key": (cde_spec["CDEFullName"], cde_spec["CDEOrigin"]),
-                    "attrs": {
-                        "origin_id": cde_spec["CDECode"],
-                        "origin_version": cde_spec.get("CDEVersion"),
-                        "origin_name": cde_spec["CDEOrigin"],
-                        "value": cde_spec["CDEFullName"],
-                    },
-                },
-                "value_set": [],
-            }
-            update_annotation = False
+            new_pvs = []
             for pv in cadsr_pvs:
                 if not pv:
                     logger.exception(
@@ -196,10 +387,19 @@ class CADSRClient:
                 if pv["value"] in mdb_pvs:
                     continue
                 logger.info("New PV found: %s", pv["value"])
-                update_annotation = True
-                annotation_spec["value_set"].append(pv)
-            if not update_annotation:
+                new_pvs.append(pv)
+            if not new_pvs:
                 continue
+            annotation_spec = make_cde_annotation_spec(cde_spec, new_pvs)
+            content_hash = get_annotation_spec_hash(annotation_spec)
+            if content_hash in seen_hashes:
+                logger.info(
+                    "Skipping duplicate PV update for %sv%s",
+                    cde_spec["CDECode"],
+                    cde_spec.get("CDEVersion"),
+                )
+                continue
+            seen_hashes.add(content_hash)
             result.append(annotation_spec)
         return result
 
@@ -236,13 +436,18 @@ class NCItClient:
             msg = "readme_url is not set"
             raise ValueError(msg)
 
-        response = requests.get(self.readme_url, timeout=DEFAULT_TIMEOUT)
-        response.raise_for_status()
+        # version is on the first line; don't download the rest of the README
+        with requests.get(
+            self.readme_url,
+            timeout=DEFAULT_TIMEOUT,
+            stream=True,
+        ) as response:
+            response.raise_for_status()
+            # iter_lines only decodes when an encoding is known
+            response.encoding = response.encoding or "utf-8"
+            first_line = next(response.iter_lines(decode_unicode=True), "") or ""
 
-        match = re.search(
-            r"NCIm version:\s*(\d{6})",
-            response.text.splitlines()[0].strip(),
-        )
+        match = NCIM_README_VERSION_PATTERN.search(first_line.strip())
         return (
             datetime.datetime.strptime(
                 match.group(1),
@@ -261,17 +466,27 @@ class NCItClient:
         if not self.zip_url:
             msg = "zip_url is not set"
             raise ValueError(msg)
-        response = requests.get(self.zip_url, timeout=DEFAULT_TIMEOUT)
-        response.raise_for_status()
-
-        with zipfile.ZipFile(io.BytesIO(response.content), "r") as zip_ref:
-            with zip_ref.open(tsv_filename) as f:
-                tsv_content = f.read()
-                if save_path:
-                    with save_path.open("wb") as save_file:
-                        save_file.write(tsv_content)
-                decoded_content = io.BytesIO(tsv_content)
-                return self.load_ncim_tsv_to_dict(decoded_content)
+        with tempfile.SpooledTemporaryFile(max_size=ZIP_SPOOL_MAX_SIZE) as zip_file:
+            with requests.get(
+                self.zip_url,
+                stream=True,
+                timeout=DEFAULT_TIMEOUT,
+            ) as response:
+                response.raise_for_status()
+                for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    zip_file.write(chunk)
+            zip_file.seek(0)
+            with (
+                zipfile.ZipFile(zip_file, "r") as zip_ref,
+                zip_ref.open(tsv_filename) as f,
+            ):
+                if not save_path:
+                    return self.load_ncim_tsv_to_dict(
+                        io.TextIOWrapper(f, encoding="utf-8", newline=""),
+                    )
+                with save_path.open("wb") as save_file:
+                    shutil.copyfileobj(f, save_file, DOWNLOAD_CHUNK_SIZE)
+        return self.load_ncim_tsv_to_dict(save_path)
 
     def load_ncim_tsv_to_dict(
         self,
@@ -283,31 +498,98 @@ class NCItClient:
             return {}
         ncim = {}
         if isinstance(ncim_tsv, Path):
-            file = ncim_tsv.open(mode="r", encoding="utf-8")
+            cached = self._load_ncim_cache(ncim_tsv)
+            if cached is not None:
+                return cached
+            file = io.TextIOWrapper(
+                ncim_tsv.open(mode="rb", buffering=DOWNLOAD_CHUNK_SIZE),
+                encoding="utf-8",
+                newline="",
+            )
         elif isinstance(ncim_tsv, io.BytesIO):
-            file = io.TextIOWrapper(ncim_tsv, encoding="utf-8")
+            file = io.TextIOWrapper(ncim_tsv, encoding="utf-8", newline="")
         else:
             file = ncim_tsv
+        select_cols = NCIM_TSV_COLUMNS
+        intern = sys.intern
+        # the same synonym often maps to several NCIt codes; share one dict
+        syn_pool: dict[tuple[str, ...], dict[str, str]] = {}
         with file as f:
-            reader = csv.reader(f, delimiter="\t")
+            # EVS mapping files are raw TSV; quote characters are literal text
+            reader = csv.reader(f, delimiter="\t", quoting=csv.QUOTE_NONE)
             next(reader, None)
             for row in reader:
-                if len(row) < 8:
+                if len(row) < NCIM_TSV_MIN_FIELDS:
                     logger.warning("NCIm TSV row is missing required fields: %s", row)
                     continue
-                nci_code = row[2]
-                syn_attrs = {
-                    "origin_id": row[4],
-                    "origin_name": row[6],
-                    "origin_version": row[7],
-                    "value": row[5],
-                }
-                if nci_code in ncim:
-                    ncim[nci_code].append(syn_attrs)
-                else:
-                    ncim[nci_code] = [syn_attrs]
+                cols = select_cols(row)
+                nci_code = cols[0]
+                syn_key = cols[1:]
+                syn_attrs = syn_pool.get(syn_key)
+                if syn_attrs is None:
+                    origin_id, value, origin_name, origin_version = syn_key
+                    # only a handful of distinct sources/versions; share one copy
+                    syn_attrs = {
+                        "origin_id": origin_id,
+                        "origin_name": intern(origin_name),
+                        "origin_version": intern(origin_version),
+                        "value": value,
+                    }
+                    syn_pool[syn_key] = syn_attrs
+                code_syns = ncim.setdefault(nci_code, [])
+                # rows differing only in unused columns (e.g. term type) project
+                # to the same pooled dict; per-code lists are short, so scan them
+                if not any(syn is syn_attrs for syn in code_syns):
+                    code_syns.append(syn_attrs)
+        if isinstance(ncim_tsv, Path):
+            self._dump_ncim_cache(ncim_tsv, ncim)
         return ncim
 
+    @staticmethod
+    def _get_ncim_cache_path(ncim_tsv: Path) -> Path:
+        """Get path of pickled NCIm mapping cache stored next to the TSV."""
+        return ncim_tsv.with_suffix(NCIM_CACHE_SUFFIX)
+
+    @staticmethod
+    def _get_ncim_tsv_signature(ncim_tsv: Path) -> tuple[int, int, int]:
+        """Get (cache version, mtime_ns, size) of NCIm TSV to validate its cache."""
+        stat = ncim_tsv.stat()
+        return (NCIM_CACHE_VERSION, stat.st_mtime_ns, stat.st_size)
+
+    def _load_ncim_cache(self, ncim_tsv: Path) -> dict | None:
+        """Load NCIm mapping from cache if it is current with the TSV."""
+        cache_path = self._get_ncim_cache_path(ncim_tsv)
+        if not cache_path.exists() or not ncim_tsv.exists():
+            return None
+        try:
+            with cache_path.open("rb") as f:
+                cached = pickle.load(f)  # noqa: S301
+        except (OSError, pickle.UnpicklingError, EOFError, ValueError):
+            logger.warning("Ignoring unreadable NCIm cache %s", cache_path)
+            return None
+        if not isinstance(cached, dict) or "data" not in cached:
+            logger.warning("Ignoring malformed NCIm cache %s", cache_path)
+            return None
+        if cached.get("signature") != self._get_ncim_tsv_signature(ncim_tsv):
+            logger.info("NCIm cache %s is stale.", cache_path)
+            return None
+        logger.info("Loaded NCIm mapping from cache %s", cache_path)
+        return cached["data"]
+
+    def _dump_ncim_cache(self, ncim_tsv: Path, ncim: dict) -> None:
+        """Save NCIm mapping cache next to the TSV, keyed by the TSV signature."""
+        cache_path = self._get_ncim_cache_path(ncim_tsv)
+        cached = {"signature": self._get_ncim_tsv_signature(ncim_tsv), "data": ncim}
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        try:
+            with tmp_path.open("wb") as f:
+                pickle.dump(cached, f, protocol=pickle.HIGHEST_PROTOCOL)
+            # atomic swap so readers never see a partially written cache
+            tmp_path.replace(cache_path)
+        except OSError:
+            logger.warning("Unable to write NCIm cache %s", cache_path)
+            tmp_path.unlink(missing_ok=True)
+
     def check_ncit_for_updated_mappings(self, *, force_update: bool = False) -> bool:
         """Check NCIt for new mappings."""
         latest = self.get_readme_date()
@@ -325,40 +607,51 @@ class NCItClient:
     ) -> list[AnnotationSpec]:
         """For MDB CDEs with PVs, check NCIt for new PV synonyms."""
         result = []
-        for cde_spec in tqdm(mdb_cdes, desc="Checking NCIt for new synonyms..."):
-            annotation_spec: AnnotationSpec = {
-                "entity": {},
-                "annotation": {
-                    "key": (cde_spec["CDEFullName"], cde_spec["CDEOrigin"]),
-                    "attrs": {
-                        "origin_id": cde_spec["CDECode"],
-                        "origin_version": cde_spec.get("CDEVersion"),
-                        "origin_name": cde_spec["CDEOrigin"],
-                        "value": cde_spec["CDEFullName"],
-                    },
-                },
-                "value_set": [],
-            }
+        # NCIm synonym keys are built once per code per call; ncim_mapping can be
+        # replaced between calls (e.g. by check_ncit_for_updated_mappings)
+        ncim_key_cache: dict[str, list[tuple[tuple[str | None, ...], dict]]] = {}
+        for cde_spec in tqdm(
+            mdb_cdes,
+            desc="Checking NCIt for new synonyms...",
+            mininterval=TQDM_MININTERVAL,
+            disable=None,
+        ):
+            updated_pvs = []
             for pv in cde_spec["permissibleValues"]:
                 mdb_synonyms = pv.get("synonyms", [])
                 logger.debug(mdb_synonyms)
-                mdb_synonyms_frozen = {frozenset(syn.items()) for syn in mdb_synonyms}
-                pv_ncit_codes = [
-                    syn.get("origin_id")
+                # dict keeps first-seen order while dropping codes listed twice
+                # (e.g. under both NCIt and NCIm)
+                pv_ncit_codes = dict.fromkeys(
+                    syn["origin_id"]
                     for syn in mdb_synonyms
-                    if syn.get("origin_name") in ["NCIt", "NCIm"]
-                ]
-                update_annotation = False
-                synonyms_to_add = []
+                    if syn.get("origin_id")
+                    and syn.get("origin_name") in NCI_SYNONYM_SOURCES
+                )
+                mapped_codes = []
                 for code in pv_ncit_codes:
-                    if not code or code not in self.ncim_mapping:
+                    if code not in self.ncim_mapping:
                         logger.info("No NCIm mapping for %s", code)
                         continue
-                    ncim_synonyms = self.ncim_mapping[code]
-                    logger.debug(ncim_synonyms)
-                    for ncim_syn in ncim_synonyms:
-                        ncim_syn_frozen = frozenset(ncim_syn.items())
-                        if ncim_syn_frozen in mdb_synonyms_frozen:
+                    mapped_codes.append(code)
+                # most PVs have no mapped code; skip building their key set
+                if not mapped_codes:
+                    continue
+                mdb_synonym_keys = {get_synonym_key(syn) for syn in mdb_synonyms}
+                update_annotation = False
+                synonyms_to_add = []
+                for code in mapped_codes:
+                    keyed_ncim_synonyms = ncim_key_cache.get(code)
+                    if keyed_ncim_synonyms is None:
+                        ncim_synonyms = self.ncim_mapping[code]
+                        logger.debug(ncim_synonyms)
+                        keyed_ncim_synonyms = [
+                            (NCIM_SYNONYM_KEY(ncim_syn), ncim_syn)
+                            for ncim_syn in ncim_synonyms
+                        ]
+                        ncim_key_cache[code] = keyed_ncim_synonyms
+                    for ncim_syn_key, ncim_syn in keyed_ncim_synonyms:
+                        if ncim_syn_key in mdb_synonym_keys:
                             logger.info("NCIm synonym already exists: %s", ncim_syn)
                             continue
                         logger.info("New synonym found: %s", ncim_syn["value"])
@@ -367,10 +660,10 @@ class NCItClient:
                 if not update_annotation:
                     continue
                 pv["synonyms"].extend(synonyms_to_add)
-                annotation_spec["value_set"].append(pv)
-            if not annotation_spec["value_set"]:
+                updated_pvs.append(pv)
+            if not updated_pvs:
                 continue
-            result.append(annotation_spec)
+            result.append(make_cde_annotation_spec(cde_spec, updated_pvs))
         return result
 
 
@@ -390,23 +683,60 @@ class GitHubClient:  # TODO: replace with GitHub API client
         }
         self.session = requests.Session()
         self.session.headers.update(self.headers)
+        self.session.mount(
+            "https://",
+            HTTPAdapter(pool_maxsize=DEFAULT_MAX_WORKERS),
+        )
 
     def get_repo_tags(self, repo: str) -> list[str] | None:
-        """Query GitHub API for tags on a given repository."""
+        """Query GitHub API for tags on a given repository, following pagination."""
         url = f"{self.BASE_URL}/repos/{repo}/tags"
-        response = self.session.get(url, timeout=DEFAULT_TIMEOUT)
-        if response.status_code != RESPONSE_200:
-            logger.error(
-                "Failed to get latest prerelease commit for %s: %s",
-                repo,
-                response.status_code,
-            )
-            response.raise_for_status()
-        tags = response.json()
-        if not tags:
+        params: dict | None = {"per_page": GITHUB_PER_PAGE}
+        tag_names = []
+        while url:
+            response = self.session.get(url, params=params, timeout=DEFAULT_TIMEOUT)
+            if response.status_code != RESPONSE_200:
+                logger.error(
+                    "Failed to get latest prerelease commit for %s: %s",
+                    repo,
+                    response.status_code,
+                )
+                response.raise_for_status()
+            tag_names.extend(tag["name"] for tag in response.json())
+            # next page URL from Link header already carries the query params
+            url = response.links.get("next", {}).get("url")
+            params = None
+        if not tag_names:
             logger.warning("No tags found for repo %s", repo)
             return []
-        return [tag["name"] for tag in tags]
+        return tag_names
+
+    def get_repo_tags_batch(self, repos: list[str]) -> dict[str, list[str] | None]:
+        """Query GitHub API for tags on several repositories concurrently."""
+        unique_repos = list(dict.fromkeys(repos))
+        with ThreadPoolExecutor(max_workers=DEFAULT_MAX_WORKERS) as executor:
+            return dict(
+                zip(
+                    unique_repos,
+                    executor.map(self.get_repo_tags, unique_repos),
+                    strict=True,
+                ),
+            )
+
+    def get_prerelease_model_info_batch(
+        self,
+        models: list[str],
+    ) -> dict[str, tuple[str, str] | None]:
+        """Get latest prerelease commit SHA & version for several models concurrently."""
+        unique_models = list(dict.fromkeys(models))
+        with ThreadPoolExecutor(max_workers=DEFAULT_MAX_WORKERS) as executor:
+            return dict(
+                zip(
+                    unique_models,
+                    executor.map(self.get_prerelease_model_info, unique_models),
+                    strict=True,
+                ),
+            )
 
     def commit_and_push_changes(
         self,
@@ -414,15 +744,29 @@ class GitHubClient:  # TODO: replace with GitHub API client
         commit_msg: str | None = None,
     ) -> None:
         """Commit and push changes to repo."""
-        try:
-            subprocess.run(["git", "add", str(file_to_commit)], check=True)
-            commit_msg = commit_msg or f"Update {file_to_commit.name}"
-            subprocess.run(["git", "commit", "-m", commit_msg], check=True)
-            subprocess.run(["git", "push"], check=True)
-            logger.info("Changes committed and pushed successfully.")
-        except subprocess.CalledProcessError:
-            logger.exception("Failed to add %s to git", file_to_commit.name)
-            return
+        commit_msg = commit_msg or f"Update {file_to_commit.name}"
+        # --only stages and commits just this (tracked) file in one process
+        git_steps = (
+            ["git", "commit", "-m", commit_msg, "--only", "--", str(file_to_commit)],
+            ["git", "push"],
+        )
+        for cmd in git_steps:
+            result = subprocess.run(
+                cmd,
+                check=False,
+                capture_output=True,
+                text=True,
+            )
+            if result.returncode != 0:
+                logger.error(
+                    "Failed to commit and push %s: '%s' exited %s: %s",
+                    file_to_commit.name,
+                    " ".join(cmd[:2]),
+                    result.returncode,
+                    result.stderr.strip(),
+                )
+                return
+        logger.info("Changes committed and pushed successfully.")
 
     def get_prerelease_model_info(self, model: str) -> tuple[str, str] | None:
         """Get latest commit SHA & version for prerelease model from DH cache."""
@@ -10,17 +10,19 @@ import logging
 # MDB Configuration Constants
 # =============================================================================
 
-VALID_MDB_IDS = [
-    "fnl-mdb-dev",
-    "fnl-mdb-qa",
-    "cloud-one-mdb-dev",
-    "cloud-one-mdb-qa",
-    "cloud-one-mdb-stage",
-    "cloud-one-mdb-prod",
-    "og-mdb-dev",
-    "og-mdb-nightly",
-    "og-mdb-prod",
-]
+VALID_MDB_IDS = frozenset(
+    {
+        "fnl-mdb-dev",
+        "fnl-mdb-qa",
+        "cloud-one-mdb-dev",
+        "cloud-one-mdb-qa",
+        "cloud-one-mdb-stage",
+        "cloud-one-mdb-prod",
+        "og-mdb-dev",
+        "og-mdb-nightly",
+        "og-mdb-prod",
+    },
+)
 
 MDB_IDS_WITH_PRERELEASES = [
     "og-mdb-nightly",
@@ -68,6 +70,8 @@ NCIM_TSV_NAME = "NCIt_Metathesaurus_Mapping_202508.txt"
 # =============================================================================
 
 DEFAULT_S3_ENDPOINT = "s3.us-east-1.amazonaws.com"
+# rows per GraphML import commit; larger batches need more Neo4j heap
+DEFAULT_GRAPHML_IMPORT_BATCH_SIZE = 50000
 
 # =============================================================================
 # Logging Configuration Constants
@@ -80,3 +84,10 @@ VALID_LOG_LEVELS = {
     "severe": logging.CRITICAL,
     "off": logging.NOTSET,
 }
+
+# =============================================================================
+# Prefect Orchestration Constants
+# =============================================================================
+
+# seconds between subflow state checks in orchestration flows (prefect default 5)
+DEPLOYMENT_POLL_INTERVAL = 1
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import re
 from datetime import UTC, datetime
+from functools import cache
 from string import Template
 from typing import TYPE_CHECKING
 
@@ -25,23 +27,53 @@ if TYPE_CHECKING:
 
 DEFAULT_COMMIT = f"CDEPV-{datetime.now(tz=UTC).strftime('%Y%m%d')}"
 DEFAULT_AUTHOR = "DEFAULT"
+DEFAULT_BATCH_SIZE = 1000
+QUOTE_ESCAPE_PATTERN = re.compile(r"\\?(['\"])")
+# fail the statement (and so the changeset) if any inner batch of
+# apoc.periodic.iterate failed; it otherwise only reports failures in its row
+PERIODIC_ITERATE_VALIDATION = (
+    "YIELD failedOperations, errorMessages "
+    "CALL apoc.util.validate(failedOperations > 0, "
+    "'periodic.iterate failed: %s', [errorMessages])"
+)
+
 
+@cache
+def get_simple_attrs(entity_cls: type[Entity]) -> tuple[str, ...]:
+    """Get names of simple attributes in an Entity class's attspec."""
+    return tuple(k for k, v in entity_cls.attspec.items() if v == "simple")
 
-def cypherize_entity(entity: Entity) -> N:
+
+def cypherize_entity(
+    entity: Entity,
+    attr_cache: dict[Entity, dict[str, str | bool]] | None = None,
+) -> N:
     """Represent metamodel Entity object as a property graph Node."""
 
     # TODO: remove custom get_attr_dict when original preserves boolean values
     def get_attr_dict_with_bool(entity: Entity) -> dict[str, str | bool]:
         """Temporary workaround to preserve boolean values in get_attr_dict."""
-        return {
-            k: str(getattr(entity, k))
-            if not isinstance(getattr(entity, k), bool)
-            else getattr(entity, k)
-            for k in entity.attspec
-            if entity.attspec[k] == "simple" and getattr(entity, k) is not None
-        }
+        attr_dict = {}
+        for k in get_simple_attrs(type(entity)):
+            val = getattr(entity, k)
+            if val is None:
+                continue
+            attr_dict[k] = val if val is True or val is False else str(val)
+        return attr_dict
+
+    if attr_cache is None:
+        props = get_attr_dict_with_bool(entity)
+    else:
+        # N copies props into its own P objects, so cached dicts stay unmodified
+        props = attr_cache.get(entity)
+        if props is None:
+            props = attr_cache[entity] = get_attr_dict_with_bool(entity)
+    return N(label=entity.get_label(), props=props)  # type: ignore reportArgumentType
+
 
-    return N(label=entity.get_label(), props=get_attr_dict_with_bool(entity))  # type: ignore reportArgumentType
+def escape_quote(match: re.Match[str]) -> str:
+    """Normalize a possibly escaped quote: ' is left bare, " is escaped."""
+    return "'" if match.group(1) == "'" else '\\"'
 
 
 def escape_quotes_in_attr(entity: Entity) -> None:
@@ -49,25 +81,17 @@ def escape_quotes_in_attr(entity: Entity) -> None:
     Escapes quotes in entity attributes.
 
     Quotes in string attributes may or may not already be escaped, so this function
-    unescapes all previously escaped ' and " characters and replaces them with
+    unescapes all previously escaped ' and " characters. " is re-escaped here; ' is
+    left bare since minicypher escapes it when rendering the single-quoted literal.
     """
-    for attr in entity.attspec:
+    # object and collection attrs are never strings
+    for attr in get_simple_attrs(type(entity)):
         val = getattr(entity, attr, None)
-        if val is not None and isinstance(val, str):
-            # First unescape any previously escaped quotes
-            unescape_val = val.replace(r"\'", "'").replace(r"\"", '"')
-
-            # Escape all quotes, use utf-8 encoded versions of backslash and quotes
-            # so extra backslash isn't added to the string
-            escape_val = unescape_val.replace(
-                r"'",
-                "\u005c\u0027",
-            ).replace(
-                r'"',
-                "\u005c\u0022",
-            )
-
-            setattr(entity, attr, escape_val)
+        # most values have no quotes; skip the regex for them entirely
+        if isinstance(val, str) and ("'" in val or '"' in val):
+            escape_val = QUOTE_ESCAPE_PATTERN.sub(escape_quote, val)
+            if escape_val != val:
+                setattr(entity, attr, escape_val)
 
 
 def reset_pg_ent_counter() -> None:
@@ -116,11 +140,10 @@ def match_tag(tag: Tag, ent_c: N) -> Match:
     parent = tag._parent  # noqa: SLF001
     par_c = N(label=parent.get_label(), props=parent.get_attr_dict())
     par_c.props.pop("_parent_handle", None)
-    # temp workaround for long matches
+    # extend the parent's MATCH patterns rather than rendering and re-parsing it
     par_match_clause = generate_match_clause(entity=parent, ent_c=par_c)
-    par_match_str = str(par_match_clause)[6:]
     tag_trip = T(par_c.plain_var(), R(Type="has_tag"), ent_c)
-    return Match(par_match_str, tag_trip)
+    return Match(*par_match_clause.args, tag_trip)
 
 
 class Case(Clause):
@@ -214,7 +237,7 @@ def create_entity_cypher_stmt(
             stmt = Statement(Merge(cypher_ent))
         # remove _commit prop of Term/VS cypher_ent for Merge
         else:
-            commit = cypher_ent.props.pop("_commit", DEFAULT_COMMIT)
+            commit = cypher_ent.props.pop("_commit")
             stmt = Statement(Merge(cypher_ent), OnCreateSet(commit))
         rollback = Statement("empty")
     else:
@@ -226,20 +249,91 @@ def create_entity_cypher_stmt(
     return stmt, rollback
 
 
+def periodic_iterate_stmt(rows: list[str], action: str, batch_size: int) -> str:
+    """
+    Wrap a Cypher action over rows in an apoc.periodic.iterate call.
+
+    Rows go in the config's params map rather than the quoted query strings, so
+    escaped attr values never need a second level of quoting.
+
+    apoc.periodic.iterate doesn't raise when inner batches fail, so its failure
+    counts are checked with apoc.util.validate to fail the whole statement.
+    """
+    return (
+        'CALL apoc.periodic.iterate("UNWIND $rows AS row RETURN row", '
+        f'"{action}", {{batchSize:{batch_size}, params:{{rows:[{",".join(rows)}]}}}}) '
+        f"{PERIODIC_ITERATE_VALIDATION}"
+    )
+
+
+def create_entities_batch_cypher_stmt(
+    entities: list[Entity],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    iterate_batch_size: int | None = None,
+) -> list[tuple[Statement, Statement]]:
+    """
+    Generate UNWIND cypher statements to create or merge Entities in batches.
+
+    Entities are grouped by label and property keys so each group is one statement
+    per batch_size entities instead of one per entity. Rows are inlined as a Cypher
+    list literal since changelog statements don't carry parameters.
+
+    If iterate_batch_size is set, each statement is an apoc.periodic.iterate call
+    committing every iterate_batch_size rows in its own inner transaction.
+    """
+    groups: dict[tuple[str, bool, tuple[str, ...], bool], list[str]] = {}
+    for entity in entities:
+        escape_quotes_in_attr(entity)
+        cypher_ent = cypherize_entity(entity)
+        cypher_ent.props.pop("_parent_handle", None)
+        merge = isinstance(entity, Term | ValueSet | Concept)
+        has_commit = merge and "_commit" in cypher_ent.props
+        keys = tuple(k for k in cypher_ent.props if not (merge and k == "_commit"))
+        row = ",".join(p.pattern() for p in cypher_ent.props.values())
+        groups.setdefault((cypher_ent.label, merge, keys, has_commit), []).append(
+            f"{{{row}}}",
+        )
+
+    stmts = []
+    for (label, merge, keys, has_commit), rows in groups.items():
+        pattern = ",".join(f"{k}:row.{k}" for k in keys)
+        ent = f"(n0:{label} {{{pattern}}})" if pattern else f"(n0:{label})"
+        if merge:
+            on_create = " ON CREATE SET n0._commit = row._commit" if has_commit else ""
+            action, undo = f"MERGE {ent}{on_create}", None
+        else:
+            action, undo = f"CREATE {ent}", f"MATCH {ent} DETACH DELETE n0"
+        for i in range(0, len(rows), batch_size):
+            batch = rows[i : i + batch_size]
+            if iterate_batch_size:
+                size = iterate_batch_size
+                stmt = Statement(periodic_iterate_stmt(batch, action, size))
+                rollback = Statement(
+                    periodic_iterate_stmt(batch, undo, size) if undo else "empty",
+                )
+            else:
+                unwind = f"UNWIND [{','.join(batch)}] AS row"
+                stmt = Statement(unwind, action)
+                rollback = Statement(unwind, undo) if undo else Statement("empty")
+            stmts.append((stmt, rollback))
+    return stmts
+
+
 def create_relationship_cypher_stmt(
     src: Entity,
     rel: str,
     dst: Entity,
+    attr_cache: dict[Entity, dict[str, str | bool]] | None = None,
 ) -> tuple[Statement, Statement]:
     """Generate cypher statement to create relationship from src to dst entity."""
     reset_pg_ent_counter()
-    cypher_src = cypherize_entity(src)
-    cypher_dst = cypherize_entity(dst)
+    cypher_src = cypherize_entity(src, attr_cache)
+    cypher_dst = cypherize_entity(dst, attr_cache)
     cypher_rel = R(Type=rel)
     # remove _commit attr from Term and VS ents
     for cypher_ent in (cypher_src, cypher_dst):
         if cypher_ent.label in ("term", "value_set") and "_commit" in cypher_ent.props:
-            cypher_ent.props.pop("_commit", DEFAULT_COMMIT)
+            cypher_ent.props.pop("_commit")
         if cypher_ent.label == "property" and "_parent_handle" in cypher_ent.props:
             cypher_ent.props.pop("_parent_handle")
     stmt_merge_trip = T(cypher_src.plain_var(), cypher_rel, cypher_dst.plain_var())
@@ -254,7 +348,7 @@ def generate_cypher_to_link_term_synonyms(
     entity_1: Entity,
     entity_2: Entity,
     mapping_source: str,
-    _commit: str | None = DEFAULT_COMMIT,
+    _commit: str | None = None,
 ) -> Statement:
     """
     Generate cypher statement to link two terms via a Concept node.
@@ -263,6 +357,8 @@ def generate_cypher_to_link_term_synonyms(
     'represents' relationship. If either Term is already connected to a Concept tagged
     by the given mapping source, that concept is used instead.
     """
+    if _commit is None:
+        _commit = DEFAULT_COMMIT
     reset_pg_ent_counter()
     cypher_ent_1 = cypherize_entity(entity_1)
     cypher_ent_2 = cypherize_entity(entity_2)
@@ -295,7 +391,7 @@ def generate_cypher_to_link_term_synonyms(
     new_concept = N(label="concept", props={"_commit": _commit})
     for cypher_ent in (cypher_ent_1, cypher_ent_2):
         if "_commit" in cypher_ent.props:
-            cypher_ent.props.pop("_commit", DEFAULT_COMMIT)
+            cypher_ent.props.pop("_commit")
     return Statement(
         Match(cypher_ent_1, cypher_ent_2),
         Where(cypher_ent_1_var, "<>", cypher_ent_2_var, op=""),
@@ -313,16 +409,17 @@ def generate_cypher_to_link_term_synonyms(
         "LIMIT 1",
         With(cypher_ent_1_var, cypher_ent_2_var),
         ",",
-        f"{Case()}{When(cypher_concept_1_var)} IS NOT NULL THEN {cypher_concept_1_var}",
-        f"{When(cypher_concept_2_var)} IS NOT NULL THEN {cypher_concept_2_var}",
+        # CASE/WHEN rendered directly rather than via Case/When clause objects
+        f"CASE WHEN {cypher_concept_1_var} IS NOT NULL THEN {cypher_concept_1_var}",
+        f"WHEN {cypher_concept_2_var} IS NOT NULL THEN {cypher_concept_2_var}",
         "ELSE NULL END AS existing_concept ",
         ForEach(),
-        f"(_ IN {Case()}{When('existing_concept')} IS NOT NULL THEN [1] ELSE [] END |",
+        "(_ IN CASE WHEN existing_concept IS NOT NULL THEN [1] ELSE [] END |",
         Merge(f"{cypher_ent_1_var}-[:represents]->(existing_concept)"),
         Merge(f"{cypher_ent_2_var}-[:represents]->(existing_concept)"),
         ")",
         ForEach(),
-        f"(_ IN {Case()}{When('existing_concept')} IS NULL THEN [1] ELSE [] END |",
+        "(_ IN CASE WHEN existing_concept IS NULL THEN [1] ELSE [] END |",
         Create(new_concept),
         Create(
             T(
@@ -344,9 +441,12 @@ def deprecate_old_model_nodes_cypher_stmt(
     model_handle: str,
 ) -> tuple[Statement, Statement]:
     """Generate cypher statement to deprecate old model node versions."""
+    reset_pg_ent_counter()
+    # minicypher renders the handle as a quote-escaped literal (n0 after reset)
+    model_ent = N(label="model", props={"handle": model_handle})
     return (
         Statement(
-            f"MATCH (n0:model {{handle: '{model_handle}'}})",
+            Match(model_ent),
             "WHERE n0.is_latest_version = true",
             "SET n0.is_latest_version = false",
         ),
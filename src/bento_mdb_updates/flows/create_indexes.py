@@ -0,0 +1,47 @@
+"""Create MDB indexes used by changelog MERGE/MATCH statements."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from prefect import flow, get_run_logger, task
+from prefect.cache_policies import NO_CACHE
+
+from bento_mdb_updates.mdb_utils import init_mdb_connection
+
+if TYPE_CHECKING:
+    from bento_meta.mdb.writeable import WriteableMDB
+
+# (index name, label, properties) for the properties changelogs MERGE/MATCH on
+MDB_INDEXES = (
+    ("term_value_idx", "term", ("value",)),
+    ("value_set_handle_idx", "value_set", ("handle",)),
+    ("concept_nanoid_idx", "concept", ("nanoid",)),
+    ("node_handle_idx", "node", ("handle",)),
+    ("property_handle_idx", "property", ("handle",)),
+    ("relationship_handle_idx", "relationship", ("handle",)),
+    ("model_handle_idx", "model", ("handle",)),
+    ("tag_key_value_idx", "tag", ("key", "value")),
+)
+
+
+def create_index_stmt(name: str, label: str, props: tuple[str, ...]) -> str:
+    """Generate idempotent cypher statement to create a range index."""
+    on_props = ", ".join(f"n.{prop}" for prop in props)
+    return f"CREATE INDEX {name} IF NOT EXISTS FOR (n:{label}) ON ({on_props})"
+
+
+@task(name="Create MDB indexes", cache_policy=NO_CACHE)
+def create_mdb_indexes(mdb: WriteableMDB) -> None:
+    """Create MDB indexes if they don't already exist."""
+    logger = get_run_logger()
+    for name, label, props in MDB_INDEXES:
+        logger.info("Creating index %s on :%s(%s)", name, label, ", ".join(props))
+        mdb.put_with_statement(create_index_stmt(name, label, props))
+
+
+@flow(name="mdb-create-indexes")
+def create_indexes_flow(mdb_id: str) -> None:
+    """Create MDB indexes; run before bulk changelog updates."""
+    mdb = init_mdb_connection(mdb_id, writeable=True, allow_empty=True)
+    create_mdb_indexes(mdb)
@@ -9,7 +9,11 @@ from zoneinfo import ZoneInfo
 from prefect import flow, get_run_logger, task
 from prefect.cache_policies import NO_CACHE
 
-from bento_mdb_updates.constants import DEFAULT_S3_ENDPOINT, MDB_REL_TYPES
+from bento_mdb_updates.constants import (
+    DEFAULT_GRAPHML_IMPORT_BATCH_SIZE,
+    DEFAULT_S3_ENDPOINT,
+    MDB_REL_TYPES,
+)
 from bento_mdb_updates.mdb_utils import init_mdb_connection
 
 if TYPE_CHECKING:
@@ -63,18 +67,21 @@ def clear_mdb_database(mdb: WriteableMDB) -> None:
     logger = get_run_logger()
 
     logger.info("Deleting relationships by type")
-    for rel in MDB_REL_TYPES:
-        rel_stmt = (
-            "CALL apoc.periodic.iterate("
-            f'"MATCH ()-[r:{rel}]-() RETURN r", '
-            '"DELETE r", '
-            "{batchSize: 5000, parallel: true, concurrency: 1}) "
-            "YIELD batches, total, timeTaken, committedOperations "
-            "RETURN batches, total, timeTaken, committedOperations"
-        )
-        result = mdb.put_with_statement(rel_stmt)
-        if result:
-            logger.info("%s relationships deleted: %s", rel, result)
+    # one pass over all types; directed so each relationship is matched once.
+    # types aren't split across concurrent calls since they share end nodes and
+    # parallel deletes would contend for the same node locks
+    rel_types = "|".join(MDB_REL_TYPES)
+    rel_stmt = (
+        "CALL apoc.periodic.iterate("
+        f'"MATCH ()-[r:{rel_types}]->() RETURN r", '
+        '"DELETE r", '
+        "{batchSize: 5000, parallel: true, concurrency: 1}) "
+        "YIELD batches, total, timeTaken, committedOperations "
+        "RETURN batches, total, timeTaken, committedOperations"
+    )
+    result = mdb.put_with_statement(rel_stmt)
+    if result:
+        logger.info("%s relationships deleted: %s", rel_types, result)
 
     logger.info("Deleting nodes and any remaining relationships")
     node_stmt = (
@@ -121,6 +128,7 @@ def import_mdb_from_s3(
     s3_url: str,
     *,
     clear_db: bool = False,
+    batch_size: int = DEFAULT_GRAPHML_IMPORT_BATCH_SIZE,
 ) -> None:
     """Import MDB from graphml file in S3."""
     logger = get_run_logger()
@@ -131,7 +139,7 @@ def import_mdb_from_s3(
     logger.info("Importing MDB from S3: %s", s3_url)
     apoc_import_stmt = (
         f"CALL apoc.import.graphml('{s3_url}', "
-        "{readLabels: true, batchSize: 10000}) "
+        f"{{readLabels: true, batchSize: {batch_size}}}) "
         "YIELD nodes, relationships, properties "
         "RETURN nodes, relationships, properties"
     )
@@ -170,11 +178,47 @@ def mdb_import_flow(
     endpoint: str = DEFAULT_S3_ENDPOINT,
     *,
     clear_db: bool = False,
+    batch_size: int = DEFAULT_GRAPHML_IMPORT_BATCH_SIZE,
 ) -> None:
     """Import MDB data from S3 into Neo4j."""
     mdb = init_mdb_connection(mdb_id, writeable=True, allow_empty=True)
     s3_url = build_s3_url(bucket, key, endpoint)
-    import_mdb_from_s3(mdb=mdb, s3_url=s3_url, clear_db=clear_db)
+    import_mdb_from_s3(
+        mdb=mdb,
+        s3_url=s3_url,
+        clear_db=clear_db,
+        batch_size=batch_size,
+    )
+
+
+@flow(name="mdb-copy-s3")
+def mdb_copy_flow(
+    src_mdb_id: str,
+    dst_mdb_id: str,
+    bucket: str,
+    endpoint: str = DEFAULT_S3_ENDPOINT,
+    *,
+    clear_db: bool = False,
+    batch_size: int = DEFAULT_GRAPHML_IMPORT_BATCH_SIZE,
+) -> str:
+    """
+    Copy MDB data between Neo4j instances via a GraphML export in S3.
+
+    Returns S3 URL of the intermediate export.
+    """
+    # connect to both up front so a bad destination fails before exporting
+    src_mdb = init_mdb_connection(src_mdb_id)
+    dst_mdb = init_mdb_connection(dst_mdb_id, writeable=True, allow_empty=True)
+    s3_key = f"{get_current_date()}__{src_mdb_id}.graphml"
+    s3_url = build_s3_url(bucket, s3_key, endpoint)
+    export_mdb_to_s3(mdb=src_mdb, s3_url=s3_url)
+    import_mdb_from_s3(
+        mdb=dst_mdb,
+        s3_url=s3_url,
+        clear_db=clear_db,
+        batch_size=batch_size,
+    )
+    return s3_url
 
 
 @flow(name="mdb-clear-database")
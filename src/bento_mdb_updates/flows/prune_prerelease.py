@@ -16,23 +16,37 @@ if TYPE_CHECKING:
 
 DEFAULT_S3_ENDPOINT = "s3.us-east-1.amazonaws.com"
 
-PRUNE_PRERELEASE_DRY_RUN_STMT = (
-    "MATCH (n) "
-    "WHERE n.version IS NOT NULL "
-    "AND n.version =~ '.*-[a-f0-9]{7}$' "
-    "RETURN count(n) as prerelease_nodes_to_delete, "
+# only these labels carry a model version, so scan them instead of every node
+VERSIONED_LABELS_CONDITION = "(n:model OR n:node OR n:property OR n:relationship)"
+
+# prerelease versions end in -<7 char commit sha>; the cheap CONTAINS check
+# drops most released versions before the regex is evaluated
+PRERELEASE_VERSION_CONDITION = (
+    f"{VERSIONED_LABELS_CONDITION} "
+    'AND n.version CONTAINS "-" AND n.version =~ ".*-[a-f0-9]{7}$"'
+)
+
+PRERELEASE_SUMMARY = (
+    "count(n) as prerelease_nodes_to_delete, "
     "collect(DISTINCT labels(n)) as node_types, "
     "collect(n.version)[0..10] as sample_versions"
 )
 
+PRUNE_PRERELEASE_DRY_RUN_STMT = (
+    f"MATCH (n) WHERE {PRERELEASE_VERSION_CONDITION} RETURN {PRERELEASE_SUMMARY}"
+)
+
+# summarizes what will be deleted and deletes it in a single call
 PRUNE_PRERELEASE_STMT = (
+    f"MATCH (n) WHERE {PRERELEASE_VERSION_CONDITION} "
+    f"WITH {PRERELEASE_SUMMARY} "
     "CALL apoc.periodic.iterate("
-    "'MATCH (n) WHERE n.version IS NOT NULL "
-    'AND n.version =~ ".*-[a-f0-9]{7}$" RETURN n\', '
+    f"'MATCH (n) WHERE {PRERELEASE_VERSION_CONDITION} RETURN n', "
     "'DETACH DELETE n', "
     "{batchSize: 1000, parallel: false}) "
     "YIELD batches, total, timeTaken, committedOperations "
-    "RETURN batches, total, timeTaken, committedOperations"
+    "RETURN prerelease_nodes_to_delete, node_types, sample_versions, "
+    "batches, total, timeTaken, committedOperations"
 )
 
 
@@ -46,22 +60,23 @@ def prune_prerelease_data(mdb: WriteableMDB, *, dry_run: bool = True) -> None:
     """Prune prerelease data from MDB."""
     logger = get_run_logger()
 
-    logger.info("Running dry run to check prerelease nodes...")
-    dry_run_result = mdb.put_with_statement(PRUNE_PRERELEASE_DRY_RUN_STMT)
-    if dry_run_result:
-        logger.info("Dry run result: %s", dry_run_result)
-    else:
-        logger.warning("Dry run returned no results")
-
-    if not dry_run:
-        logger.info("Executing batch deletion of prerelease data from MDB")
-        result = mdb.put_with_statement(PRUNE_PRERELEASE_STMT)
-        if result:
-            logger.info("Batch deletion result: %s", result)
-            return
-        deletion_fail_msg = "Batch deletion failed - no results returned"
-        raise RuntimeError(deletion_fail_msg)
-    logger.info("Dry run complete. Set dry_run=False to execute actual deletion.")
+    if dry_run:
+        logger.info("Running dry run to check prerelease nodes...")
+        dry_run_result = mdb.put_with_statement(PRUNE_PRERELEASE_DRY_RUN_STMT)
+        if dry_run_result:
+            logger.info("Dry run result: %s", dry_run_result)
+        else:
+            logger.warning("Dry run returned no results")
+        logger.info("Dry run complete. Set dry_run=False to execute actual deletion.")
+        return
+
+    logger.info("Executing batch deletion of prerelease data from MDB")
+    result = mdb.put_with_statement(PRUNE_PRERELEASE_STMT)
+    if result:
+        logger.info("Batch deletion result: %s", result)
+        return
+    deletion_fail_msg = "Batch deletion failed - no results returned"
+    raise RuntimeError(deletion_fail_msg)
 
 
 @flow(name="mdb-prune-prerelease")
@@ -13,6 +13,8 @@ from prefect.cache_policies import INPUTS
 from bento_mdb_updates.mdb_utils import init_mdb_connection
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from bento_meta.mdb import MDB
 
 no_cache_mdb = INPUTS - "mdb"
@@ -65,6 +67,21 @@ def execute_cypher(
     return result
 
 
+def iter_queries(query: list) -> Iterator[str]:
+    """Yield queries, streaming them one per line if given a single file path."""
+    if len(query) == 1:
+        qpath = Path(query[0])
+        if qpath.exists():
+            with qpath.open() as f:
+                for line in f:
+                    q = line.strip()
+                    # skip blank and comment lines rather than sending no-ops
+                    if q and not q.startswith("//"):
+                        yield q
+            return
+    yield from query
+
+
 @flow(name="run-cypher", log_prints=True)
 def run_cypher_flow(
     mdb_id: str,
@@ -84,12 +101,7 @@ def run_cypher_flow(
     if params:
         logger.info(" with params:\n%s", params)
 
-    if len(query) == 1:
-        qpath = Path(query[0])
-        if qpath.exists():
-            query = list(qpath.open())
-
-    for q in query:
+    for q in iter_queries(query):
         try:
             result = execute_cypher(mdb, q, params)
             results.append(result)
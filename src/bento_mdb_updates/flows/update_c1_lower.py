@@ -3,6 +3,7 @@
 from prefect import flow, get_run_logger
 from prefect.deployments import run_deployment
 
+from bento_mdb_updates.constants import DEPLOYMENT_POLL_INTERVAL
 from bento_mdb_updates.flows.mdb_s3 import get_current_date
 
 
@@ -23,6 +24,7 @@ def update_c1_lower_flow(
             "clear_db": True,
         },
         timeout=None,
+        poll_interval=DEPLOYMENT_POLL_INTERVAL,
         as_subflow=True,
     )
     logger.info("Exporting from cloud-one-mdb-dev to cloudone-mdb-data bucket")
@@ -33,6 +35,7 @@ def update_c1_lower_flow(
             "bucket": "cloudone-mdb-data",
         },
         timeout=None,
+        poll_interval=DEPLOYMENT_POLL_INTERVAL,
         as_subflow=True,
     )
     current_date = get_current_date()
@@ -47,6 +50,7 @@ def update_c1_lower_flow(
             "clear_db": True,
         },
         timeout=None,
+        poll_interval=DEPLOYMENT_POLL_INTERVAL,
         as_subflow=True,
     )
     logger.info("Pruning prerelease data from cloud-one-mdb-qa")
@@ -57,5 +61,6 @@ def update_c1_lower_flow(
             "dry_run": False,
         },
         timeout=None,
+        poll_interval=DEPLOYMENT_POLL_INTERVAL,
         as_subflow=True,
     )
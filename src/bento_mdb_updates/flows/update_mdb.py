@@ -11,11 +11,11 @@ from contextlib import redirect_stderr, redirect_stdout
 from pathlib import Path
 
 from prefect import flow, get_run_logger, task
-from prefect.blocks.system import Secret
 from prefect.logging.handlers import APILogHandler
 from pyliquibase import Pyliquibase
 
 from bento_mdb_updates.constants import VALID_LOG_LEVELS, VALID_MDB_IDS
+from bento_mdb_updates.mdb_utils import get_mdb_credentials
 
 # liquibase constants
 DRIVER_PATH = "/app/drivers"
@@ -37,7 +37,7 @@ def set_defaults_file(
     """Create temporary defaults file; returns paths of defaults file and log file."""
     logger = get_run_logger()
     if mdb_id not in VALID_MDB_IDS:
-        msg = f"Invalid MDB ID: {mdb_id}. Valid IDs: {VALID_MDB_IDS}"
+        msg = f"Invalid MDB ID: {mdb_id}. Valid IDs: {sorted(VALID_MDB_IDS)}"
         raise ValueError(msg)
     if log_level not in VALID_LOG_LEVELS:
         logger.warning(
@@ -47,14 +47,7 @@ def set_defaults_file(
         )
         log_level = "info"
 
-    uri_secret_name = mdb_id + "-uri"
-    usr_secret_name = mdb_id + "-usr"
-    pwd_secret_name = mdb_id + "-pwd"
-    uri = Secret.load(uri_secret_name).get()  # type: ignore reportAttributeAccessIssue
-    user = Secret.load(usr_secret_name).get()  # type: ignore reportAttributeAccessIssue
-    password = Secret.load(pwd_secret_name).get()  # type: ignore reportAttributeAccessIssue
-    if mdb_id.startswith("og-mdb"):
-        password = ""  # can't set empty string in prefect secrets
+    uri, user, password = get_mdb_credentials(mdb_id)
 
     # create liquibase log file
     log_file = tempfile.NamedTemporaryFile(suffix=".log", delete=False)  # noqa: SIM115
@@ -3,6 +3,8 @@
 from prefect import flow, get_run_logger
 from prefect.deployments import run_deployment
 
+from bento_mdb_updates.constants import DEPLOYMENT_POLL_INTERVAL
+
 
 @flow(name="update-mdb-and-dh")
 def update_mdb_and_dh_flow(
@@ -27,6 +29,7 @@ def update_mdb_and_dh_flow(
             "dry_run": dry_run,
         },
         timeout=None,
+        poll_interval=DEPLOYMENT_POLL_INTERVAL,
         as_subflow=True,
     )
     run_deployment(
@@ -37,5 +40,6 @@ def update_mdb_and_dh_flow(
             "no_commit": no_commit,
         },
         timeout=None,
+        poll_interval=DEPLOYMENT_POLL_INTERVAL,
         as_subflow=True,
     )
@@ -2,12 +2,25 @@
 
 from __future__ import annotations
 
+import atexit
+import contextvars
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
 from bento_meta.mdb import MDB
 from bento_meta.mdb.writeable import WriteableMDB
+from neo4j.exceptions import DriverError
 from prefect.blocks.system import Secret
 
 from bento_mdb_updates.constants import VALID_MDB_IDS
 
+# open connections by (uri, user, writeable), shared by MDB IDs on the same server;
+# each MDB holds a Neo4j driver and its connection pool. models are re-read from
+# the DB whenever a cached MDB is handed out, since flows load and clear models
+_MDB_CONNECTIONS: dict[tuple[str, str, bool], MDB | WriteableMDB] = {}
+_MDB_CONNECTIONS_LOCK = threading.Lock()
+
 
 def init_mdb_connection(
     mdb_id: str,
@@ -15,36 +28,126 @@ def init_mdb_connection(
     writeable: bool = False,
     allow_empty: bool = False,
 ) -> MDB | WriteableMDB:
-    """Initialize MDB connection."""
+    """Initialize MDB connection, reusing an open one to the same server."""
     if mdb_id not in VALID_MDB_IDS:
-        msg = f"Invalid MDB ID: {mdb_id}. Valid IDs: {VALID_MDB_IDS}"
+        msg = f"Invalid MDB ID: {mdb_id}. Valid IDs: {sorted(VALID_MDB_IDS)}"
         raise ValueError(msg)
 
-    uri_secret_name = mdb_id + "-uri"
-    usr_secret_name = mdb_id + "-usr"
-    pwd_secret_name = mdb_id + "-pwd"
-    uri = Secret.load(uri_secret_name).get()  # type: ignore reportAttributeAccessIssue
-    user = Secret.load(usr_secret_name).get()  # type: ignore reportAttributeAccessIssue
-    password = Secret.load(pwd_secret_name).get()  # type: ignore reportAttributeAccessIssue
-    if mdb_id.startswith("og-mdb"):
-        password = ""  # can't set empty string in prefect secrets
+    uri, user, password = get_mdb_credentials(mdb_id)
     if uri.startswith("jdbc:neo4j:"):
         uri = uri.replace("jdbc:neo4j:", "")
+    key = (uri, user, writeable)
+    # network round-trips happen outside the lock so callers for other servers
+    # (or other threads) aren't serialized behind a handshake or model query
+    with _MDB_CONNECTIONS_LOCK:
+        mdb = _MDB_CONNECTIONS.get(key)
+    if mdb is not None:
+        try:
+            refresh_mdb_models(mdb)
+            verify_mdb_connection(mdb, allow_empty=allow_empty)
+        except (ConnectionError, DriverError):
+            # broken connection; reconnect with a new driver. any other
+            # failure (e.g. an empty MDB) leaves the shared driver in place
+            with _MDB_CONNECTIONS_LOCK:
+                if _MDB_CONNECTIONS.get(key) is mdb:
+                    del _MDB_CONNECTIONS[key]
+            mdb.close()
+        else:
+            return mdb
+    mdb = connect_mdb(uri, user, password, writeable=writeable)
+    try:
+        verify_mdb_connection(mdb, allow_empty=allow_empty)
+    except Exception:
+        mdb.close()
+        raise
+    with _MDB_CONNECTIONS_LOCK:
+        cached = _MDB_CONNECTIONS.setdefault(key, mdb)
+    if cached is not mdb:
+        # another thread connected first; keep its driver
+        mdb.close()
+    return cached
 
+
+def refresh_mdb_models(mdb: MDB) -> None:
+    """
+    Re-read models and their latest versions from the DB into an MDB.
+
+    MDB only reads these at construction; this mirrors that logic so a reused
+    connection reflects models loaded or cleared since. The MDB may be shared
+    with other callers, so new dicts are built and swapped in rather than
+    mutated in place; readers holding the old dicts keep a consistent view.
+    """
+    models: dict[str, list[str]] = {}
+    latest_version: dict[str, str | None] = {}
+    for m in mdb.get_model_info() or []:
+        models.setdefault(m["handle"], []).append(m["version"])
+        if m.get("is_latest_version") and not latest_version.get(m["handle"]):
+            latest_version[m["handle"]] = m["version"]
+    for hdl, versions in models.items():
+        if not latest_version.get(hdl):
+            # only one version means it's the latest
+            latest_version[hdl] = (
+                (versions[0] or "unversioned") if len(versions) == 1 else None
+            )
+    mdb.models = models
+    mdb.latest_version = latest_version
+
+
+def connect_mdb(
+    uri: str,
+    user: str,
+    password: str,
+    *,
+    writeable: bool = False,
+) -> MDB | WriteableMDB:
+    """Create a new MDB connection."""
     if writeable:
-        mdb = WriteableMDB(
+        return WriteableMDB(
             uri=uri,
             user=user,
             password=password,
         )
-    else:
-        mdb = MDB(
-            uri=uri,
-            user=user,
-            password=password,
-        )
-    verify_mdb_connection(mdb, allow_empty=allow_empty)
-    return mdb
+    return MDB(
+        uri=uri,
+        user=user,
+        password=password,
+    )
+
+
+@lru_cache(maxsize=32)
+def get_mdb_credentials(mdb_id: str) -> tuple[str, str, str]:
+    """
+    Get (uri, user, password) for MDB from Prefect secrets.
+
+    Cached per mdb_id for the life of the process; call
+    get_mdb_credentials.cache_clear() to pick up rotated secrets.
+    """
+    secret_names = (mdb_id + "-uri", mdb_id + "-usr", mdb_id + "-pwd")
+    # each load is a blocking API call; fetch all three at once. the caller's
+    # context (e.g. Prefect run context) is copied into each worker thread
+    with ThreadPoolExecutor(max_workers=len(secret_names)) as executor:
+        futures = [
+            executor.submit(contextvars.copy_context().run, load_secret, name)
+            for name in secret_names
+        ]
+        uri, user, password = (future.result() for future in futures)
+    if mdb_id.startswith("og-mdb"):
+        password = ""  # can't set empty string in prefect secrets
+    return uri, user, password
+
+
+def load_secret(name: str) -> str:
+    """Load value of Prefect Secret block."""
+    return Secret.load(name).get()  # type: ignore reportAttributeAccessIssue
+
+
+@atexit.register
+def close_mdb_connections() -> None:
+    """Close and forget all open MDB connections."""
+    with _MDB_CONNECTIONS_LOCK:
+        for mdb in _MDB_CONNECTIONS.values():
+            mdb.close()
+        _MDB_CONNECTIONS.clear()
 
 
 def verify_mdb_connection(mdb: MDB, *, allow_empty: bool = False) -> None:
@@ -59,7 +162,8 @@ def verify_mdb_connection(mdb: MDB, *, allow_empty: bool = False) -> None:
         msg = f"Failed to connect to MDB: {mdb.uri}"
         raise ConnectionError(msg)
     if not allow_empty:
-        if not hasattr(mdb, "models") or mdb.models is None or len(mdb.models) == 0:
+        # checks models cached on the MDB; init_mdb_connection refreshes them
+        if not mdb.models:
             msg = f"No model information could be retrieved from MDB: {mdb.uri}"
             raise RuntimeError(msg)
         print(f"MDB connection validated: {len(mdb.models)} models found in database")
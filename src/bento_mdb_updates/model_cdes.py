@@ -2,12 +2,25 @@
 
 from __future__ import annotations
 
+import copy
 import logging
 import re
+from functools import cache
+from itertools import chain
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import IO, TYPE_CHECKING
 
+import orjson
 import yaml
+from tqdm.contrib.concurrent import thread_map
+
+from bento_mdb_updates.clients import DEFAULT_MAX_WORKERS, TQDM_MININTERVAL
+
+try:
+    from yaml import CSafeDumper as SafeDumper
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper, SafeLoader
 
 if TYPE_CHECKING:
     from bento_meta.mdb.mdb import MDB
@@ -18,20 +31,28 @@ if TYPE_CHECKING:
         MDBCDESpec,
         ModelCDESpec,
         ModelSpec,
-        PermissibleValue,
     )
 
 logger = logging.getLogger(__name__)
 
+# prerelease versions end with a short commit hash, e.g. 1.2.3-abcd123
+PRERELEASE_VERSION_PATTERN = re.compile(r"-[a-f0-9]{7}$", re.IGNORECASE)
 
-def load_model_specs_from_yaml(yaml_file: Path) -> dict[str, ModelSpec]:
-    """Load model specs from YAML file."""
-    with Path(yaml_file).open(mode="r", encoding="utf-8") as f:
-        try:
-            return yaml.safe_load(f)
-        except yaml.YAMLError as exc:
-            msg = f"Error parsing YAML file {yaml_file}: {exc}"
-            raise yaml.YAMLError(msg) from exc
+
+def load_model_specs_from_yaml(yaml_file: Path | IO[str]) -> dict[str, ModelSpec]:
+    """Load model specs from YAML file path or open text stream."""
+    # parse from one in-memory read rather than many small stream reads
+    if hasattr(yaml_file, "read"):
+        data = yaml_file.read()
+        source = getattr(yaml_file, "name", "<stream>")
+    else:
+        data = Path(yaml_file).read_bytes()
+        source = yaml_file
+    try:
+        return yaml.load(data, Loader=SafeLoader)
+    except yaml.YAMLError as exc:
+        msg = f"Error parsing YAML file {source}: {exc}"
+        raise yaml.YAMLError(msg) from exc
 
 
 def get_yaml_files_from_spec(
@@ -45,7 +66,7 @@ def get_yaml_files_from_spec(
     mdf_directory = model_spec.get("mdf_directory", "")
     mdf_files = model_spec.get("mdf_files", [])
 
-    is_prerelease = bool(re.search(r"-[a-f0-9]{7}$", version, re.IGNORECASE))
+    is_prerelease = bool(PRERELEASE_VERSION_PATTERN.search(version))
     if is_prerelease:
         logger.info("Is prerelease version: %s", version)
         repo = "CBIIT/crdc-datahub-models"
@@ -74,76 +95,117 @@ def get_yaml_files_from_spec(
     return [f"{base_url}/{file}" for file in mdf_files]
 
 
+@cache
+def is_cadsr_origin(origin_name: str) -> bool:
+    """Check if term origin name is caDSR, i.e. the term is a CDE."""
+    return "cadsr" in origin_name.lower()
+
+
 def count_model_cdes(model: Model) -> int:
     """Count CDEs in a model."""
-    count = 0
-    for term_key in model.terms:
-        if "cadsr" in term_key[1].lower():
-            count += 1
-    return count
+    return sum(1 for term_key in model.terms if is_cadsr_origin(term_key[1]))
 
 
 def make_model_cde_spec(model: Model) -> ModelCDESpec:
     """Get CDEs from a bento-meta model."""
-    cde_spec: ModelCDESpec = {
+    entities = chain(model.nodes.items(), model.edges.items(), model.props.items())
+    return {
         "handle": str(model.handle),
         "version": str(model.version),
-        "annotations": [],
+        "annotations": [
+            {
+                "entity": {
+                    "key": entity_key,
+                    "attrs": entity.get_attr_dict(),
+                    "entity_has_enum": bool(entity.value_set),
+                },
+                "annotation": {
+                    "key": term_key,
+                    "attrs": term.get_attr_dict(),
+                },
+                "value_set": [],
+            }
+            for entity_key, entity in entities
+            if entity.concept and entity.concept.terms
+            for term_key, term in entity.concept.terms.items()
+            # if 'caDSR' not in origin name, not a CDE
+            if is_cadsr_origin(term_key[1])
+        ],
     }
-    for entity_type in ["nodes", "edges", "props"]:
-        model_entities = getattr(model, entity_type)
-        for entity_key, entity in model_entities.items():
-            if not entity.concept or not entity.concept.terms:
-                continue
-            for term_key, term in entity.concept.terms.items():
-                # if 'caDSR' not in origin name, not a CDE
-                if "cadsr" not in term_key[1].lower():
-                    continue
-                cde_spec["annotations"].append(
-                    {
-                        "entity": {
-                            "key": entity_key,
-                            "attrs": entity.get_attr_dict(),
-                            "entity_has_enum": bool(entity.value_set),
-                        },
-                        "annotation": {
-                            "key": term_key,
-                            "attrs": term.get_attr_dict(),
-                        },
-                        "value_set": [],
-                    },
-                )
-    return cde_spec
 
 
 def dump_to_yaml(py_object: object, yaml_file: Path) -> None:
     """Safe dump Python object to YAML file."""
     with Path(yaml_file).open(mode="w", encoding="utf-8") as f:
-        yaml.safe_dump(
+        yaml.dump(
             py_object,
             f,
+            Dumper=SafeDumper,
             sort_keys=False,
             default_flow_style=False,
         )
 
 
+def dump_to_json(py_object: object, json_file: Path) -> None:
+    """Dump Python object to JSON file (machine-read caches, e.g. CDE specs)."""
+    json_file = Path(json_file)
+    json_file.parent.mkdir(parents=True, exist_ok=True)
+    json_file.write_bytes(orjson.dumps(py_object))
+
+
+def dump_model_cde_spec_to_json(model_cde_spec: ModelCDESpec, json_file: Path) -> None:
+    """
+    Dump ModelCDESpec to JSON file one annotation at a time.
+
+    Avoids serializing the whole spec (value sets, synonyms) to a single buffer.
+    """
+    json_file = Path(json_file)
+    json_file.parent.mkdir(parents=True, exist_ok=True)
+    header = {k: v for k, v in model_cde_spec.items() if k != "annotations"}
+    with json_file.open(mode="wb") as f:
+        f.write(orjson.dumps(header)[:-1])
+        f.write(b',"annotations":[' if header else b'"annotations":[')
+        for i, annotation in enumerate(model_cde_spec["annotations"]):
+            if i:
+                f.write(b",")
+            f.write(orjson.dumps(annotation))
+        f.write(b"]}")
+
+
 def add_cde_pvs_to_model_cde_spec(
     cde_spec: ModelCDESpec,
     cadsr_client: CADSRClient,
 ) -> None:
     """Add CDE PVs to a ModelCDESpec."""
     logger.info("Getting CDE value sets from caDSR...")
-    for annotation in cde_spec["annotations"]:
-        cde_id = annotation["annotation"]["attrs"].get("origin_id")
-        cde_version = annotation["annotation"]["attrs"].get("origin_version")
-        entity_key = str(annotation["entity"]["key"])
-        value_set = cadsr_client.fetch_cde_valueset(
-            cde_id,
-            cde_version,
-            entity_key,
-        )
+    annotations = cde_spec["annotations"]
+    # fetch each distinct CDE once; entity key is only used in error messages
+    cde_entity_keys: dict[tuple[str | None, str | None], str] = {}
+    for annotation in annotations:
+        attrs = annotation["annotation"]["attrs"]
+        cde_key = (attrs.get("origin_id"), attrs.get("origin_version"))
+        cde_entity_keys.setdefault(cde_key, str(annotation["entity"]["key"]))
+    # fetches overlap across threads; progress tracks completed fetches
+    value_sets = thread_map(
+        lambda item: cadsr_client.fetch_cde_valueset(*item[0], item[1]),
+        list(cde_entity_keys.items()),
+        max_workers=DEFAULT_MAX_WORKERS,
+        desc="Getting CDE value sets from caDSR...",
+        mininterval=TQDM_MININTERVAL,
+        disable=None,
+    )
+    cde_value_sets = dict(zip(cde_entity_keys, value_sets, strict=True))
+    used_cde_keys = set()
+    for annotation in annotations:
+        attrs = annotation["annotation"]["attrs"]
+        cde_key = (attrs.get("origin_id"), attrs.get("origin_version"))
+        value_set = cde_value_sets[cde_key]
         if not value_set:
             continue
+        # synonyms are added per PV later, so repeat annotations get own copy
+        if cde_key in used_cde_keys:
+            value_set = copy.deepcopy(value_set)
+        used_cde_keys.add(cde_key)
         annotation["value_set"] = value_set
 
 
@@ -153,6 +215,7 @@ def add_ncit_synonyms_to_model_cde_spec(
 ) -> None:
     """Add NCIt synonyms to a ModelCDESpec."""
     logger.info("Getting synonyms from NCIt...")
+    ncim_mapping = ncit_client.ncim_mapping
     for annotation in cde_spec["annotations"]:
         value_set = annotation.get("value_set", [])
         for pv in value_set:
@@ -166,28 +229,34 @@ def add_ncit_synonyms_to_model_cde_spec(
                     pv["value"],
                     ncit_concept_codes,
                 )
-            for code in ncit_concept_codes:
-                if not code or code not in ncit_client.ncim_mapping:
-                    continue
-                syn_dicts = ncit_client.ncim_mapping[code]
-                for syn_attrs in syn_dicts:
-                    pv["synonyms"].append(syn_attrs)
+            pv["synonyms"].extend(
+                chain.from_iterable(
+                    ncim_mapping.get(code, ()) for code in ncit_concept_codes if code
+                ),
+            )
 
         annotation["value_set"] = value_set
 
 
 def load_model_cde_spec(model_handle: str, model_version: str) -> ModelCDESpec:
-    """Load model cdes from spec."""
-    cde_dir = Path().cwd() / "data/output/model_cde_pvs"
-    model_cdes_yml = cde_dir / model_handle / f"{model_handle}_{model_version}_cdes.yml"
-
-    with model_cdes_yml.open(mode="r", encoding="utf-8") as f:
+    """Load model cdes from spec; falls back to legacy YAML spec if no JSON."""
+    cde_dir = Path().cwd() / "data/output/model_cde_pvs" / model_handle
+    model_cdes_json = cde_dir / f"{model_handle}_{model_version}_cdes.json"
+    if model_cdes_json.exists():
         try:
-            return yaml.load(f, Loader=yaml.FullLoader)  # noqa: S506
-        except yaml.YAMLError as e:
-            msg = f"Error parsing YAML file {model_cdes_yml}: {e}"
+            return orjson.loads(model_cdes_json.read_bytes())
+        except orjson.JSONDecodeError as e:
+            msg = f"Error parsing JSON file {model_cdes_json}: {e}"
             raise ValueError(msg) from e
 
+    model_cdes_yml = cde_dir / f"{model_handle}_{model_version}_cdes.yml"
+    data = model_cdes_yml.read_bytes()
+    try:
+        return yaml.load(data, Loader=SafeLoader)
+    except yaml.YAMLError as e:
+        msg = f"Error parsing YAML file {model_cdes_yml}: {e}"
+        raise ValueError(msg) from e
+
 
 def compare_model_specs_to_mdb(
     model_specs: dict[str, ModelSpec],
@@ -217,11 +286,12 @@ def compare_model_specs_to_mdb(
 
     logger.info("MDB models=%s", mdb_models)
     logger.info("Spec models=%s", spec_models)
-    return {
-        model: sorted(set(versions) - set(mdb_models.get(model, [])))
-        for model, versions in spec_models.items()
-        if set(versions) - set(mdb_models.get(model, []))
-    }
+    new_versions = {}
+    for model, versions in spec_models.items():
+        diff = set(versions).difference(mdb_models.get(model, ()))
+        if diff:
+            new_versions[model] = sorted(diff)
+    return new_versions
 
 
 def get_cdes_from_mdb(mdb: MDB) -> list[MDBCDESpec]:
@@ -247,28 +317,13 @@ def get_cdes_from_mdb(mdb: MDB) -> list[MDBCDESpec]:
         "syn.origin_version}) AS synonyms "
         "WITH cde, models, COLLECT(DISTINCT {value: pv.value, origin_id: pv.origin_id, "
         "origin_definition: pv.origin_definition, origin_version: pv.origin_version, "
-        "origin_name: pv.origin_name, synonyms: synonyms}) "
+        "origin_name: pv.origin_name, synonyms: synonyms, "
+        "ncit_concept_codes: apoc.coll.sort(apoc.coll.toSet([syn IN synonyms "
+        "WHERE syn.origin_name = 'NCIt' AND syn.origin_id IS NOT NULL "
+        "| syn.origin_id]))}) "
         "AS permissibleValues "
         "RETURN cde.origin_id AS CDECode, cde.origin_version AS CDEVersion, "
         "cde.value AS CDEFullName, cde.origin_name AS CDEOrigin, "
         "models, permissibleValues "
     )
     return mdb.get_with_statement(qry)  # type: ignore ReportReturnType
-
-
-def set_ncit_concept_codes(pv: PermissibleValue) -> None:
-    """Set ncit_concept_codes for a PV with NCIt synonyms."""
-    pv["ncit_concept_codes"] = sorted(
-        {
-            syn["origin_id"]
-            for syn in pv.get("synonyms", [])
-            if syn.get("origin_name") == "NCIt" and syn.get("origin_id") is not None
-        },
-    )
-
-
-def process_mdb_cdes(mdb_cdes: list[MDBCDESpec]) -> None:
-    """Perform additional processing on MDB CDEs."""
-    for cde_spec in mdb_cdes:
-        for pv in cde_spec["permissibleValues"]:
-            set_ncit_concept_codes(pv)
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from itertools import chain
 from typing import TYPE_CHECKING
 
 from bento_meta.model import Model, make_nanoid
@@ -12,9 +13,11 @@ from liquichange.changelog import Changelog, Changeset, CypherChange, Rollback
 
 from bento_mdb_updates.cypher_utils import (
     Statement,
+    create_entities_batch_cypher_stmt,
     create_entity_cypher_stmt,
     create_relationship_cypher_stmt,
     deprecate_old_model_nodes_cypher_stmt,
+    escape_quotes_in_attr,
 )
 
 if TYPE_CHECKING:
@@ -46,21 +49,26 @@ def separate_shared_props(model: Model) -> None:
     This ensures each entity has its own copy.
     """
     initial_props = set()
+    shared_props = []
 
     for key, prop in model.props.items():
         if prop in initial_props:
-            new_prop = prop.dup()
-            if new_prop.nanoid:
-                new_prop.nanoid = make_nanoid()
-            if prop._commit:  # noqa: SLF001
-                new_prop._commit = prop._commit  # noqa: SLF001
-            if prop.value_set:
-                new_prop.value_set = prop.value_set.dup()
-            model.nodes[key[0]].props[key[1]] = new_prop
-            model.props[(key[0], key[1])] = new_prop
+            shared_props.append((key, prop))
         else:
             initial_props.add(prop)
 
+    # replace after iterating so model.props isn't written to mid-iteration
+    for key, prop in shared_props:
+        new_prop = prop.dup()
+        if new_prop.nanoid:
+            new_prop.nanoid = make_nanoid()
+        if prop._commit:  # noqa: SLF001
+            new_prop._commit = prop._commit  # noqa: SLF001
+        if prop.value_set:
+            new_prop.value_set = prop.value_set.dup()
+        model.nodes[key[0]].props[key[1]] = new_prop
+        model.props[(key[0], key[1])] = new_prop
+
 
 class ModelToChangelogConverter:
     """Class to convert bento-meta model object to a liquibase changelog."""
@@ -71,16 +79,41 @@ class ModelToChangelogConverter:
         *,
         add_rollback: bool = True,
         terms_only: bool = False,
+        batch_size: int | None = None,
+        iterate_batch_size: int | None = None,
+        statements_per_changeset: int = 1,
     ) -> None:
-        """Initialize converter and structures to hold cypher stmts & added entities."""
+        """
+        Initialize converter and structures to hold cypher stmts & added entities.
+
+        If batch_size is set, entities are created by UNWIND statements of up to
+        batch_size entities each instead of one statement per entity.
+        iterate_batch_size additionally runs each of those as an apoc.periodic.iterate
+        call that commits every iterate_batch_size entities.
+        statements_per_changeset groups that many statements of the same type
+        into one changeset, which Liquibase applies in a single transaction.
+        """
         self.add_rollback = add_rollback
         self.terms_only = terms_only
+        self.batch_size = batch_size
+        self.iterate_batch_size = iterate_batch_size
+        self.statements_per_changeset = max(statements_per_changeset, 1)
         self.model = model
+        # Tag() copies from this dict, so one template serves every concept
+        self.mapping_source_attrs = {"key": "mapping_source", "value": model.handle}
         self.cypher_stmts: dict[str, dict[str, list[Statement]]] = {
             "add_ents": {"statements": [], "rollbacks": []},
             "add_rels": {"statements": [], "rollbacks": []},
         }
-        self.added_entities = []
+        # entities hash by identity, so this dedupes the same object seen twice
+        self.added_entities: set[Entity] = set()
+        # entities to create in batches when self.batch_size is set
+        self.batched_entities: list[Entity] = []
+        # entities whose tags/terms/concept/origin have been traversed; shared
+        # concepts & terms are linked from every parent but only descended once
+        self.expanded_entities: set[Entity] = set()
+        # entity attrs reused across the many relationships an entity is part of
+        self.attr_cache: dict[Entity, dict[str, str | bool]] = {}
 
     def add_statement(
         self,
@@ -99,12 +132,35 @@ class ModelToChangelogConverter:
         """Generate cypher statement to create or merge Entity."""
         stmt_type = "add_ents"
         if entity in self.added_entities:
-            msg = f"Entity with attrs: {entity.get_attr_dict()} already added."
-            logger.info(msg)
+            # revisits are routine for shared entities; only build attrs if logged
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Entity with attrs: %s already added.",
+                    entity.get_attr_dict(),
+                )
             return
-        stmt, rollback = create_entity_cypher_stmt(entity)
-        self.add_statement(stmt_type, stmt, rollback)
-        self.added_entities.append(entity)
+        if self.batch_size:
+            # escape now so relationships match the attrs the batch will create
+            escape_quotes_in_attr(entity)
+            self.batched_entities.append(entity)
+        else:
+            stmt, rollback = create_entity_cypher_stmt(entity)
+            self.add_statement(stmt_type, stmt, rollback)
+        # creating escapes the entity's attrs; drop any attrs cached before that
+        self.attr_cache.pop(entity, None)
+        self.added_entities.add(entity)
+
+    def add_batched_entity_statements(self) -> None:
+        """Add batched UNWIND statements for entities collected in batch mode."""
+        if not self.batched_entities:
+            return
+        for stmt, rollback in create_entities_batch_cypher_stmt(
+            self.batched_entities,
+            self.batch_size or len(self.batched_entities),
+            self.iterate_batch_size,
+        ):
+            self.add_statement("add_ents", stmt, rollback)
+        self.batched_entities = []
 
     def generate_cypher_to_add_relationship(
         self,
@@ -114,14 +170,27 @@ class ModelToChangelogConverter:
     ) -> None:
         """Generate cypher statement to create relationship from src to dst entity."""
         stmt_type = "add_rels"
-        stmt, rollback = create_relationship_cypher_stmt(src, rel, dst)
+        stmt, rollback = create_relationship_cypher_stmt(
+            src,
+            rel,
+            dst,
+            self.attr_cache,
+        )
         self.add_statement(stmt_type, stmt, rollback)
 
+    def first_expansion(self, entity: Entity) -> bool:
+        """Return True the first time an entity's attributes are traversed."""
+        if entity in self.expanded_entities:
+            return False
+        self.expanded_entities.add(entity)
+        return True
+
     def process_tags(self, entity: Entity) -> None:
         """Generate cypher statements to create/merge an entity's tag attributes."""
-        if not entity.tags:
+        tags = entity.tags
+        if not tags:
             return
-        for tag in entity.tags.values():
+        for tag in tags.values():
             if not tag.nanoid:
                 tag.nanoid = make_nanoid()
             if not tag._parent:  # noqa: SLF001
@@ -131,60 +200,66 @@ class ModelToChangelogConverter:
 
     def process_origin(self, entity: Entity) -> None:
         """Generate cypher statements to create/merge an entity's origin attribute."""
-        if not entity.origin:
+        origin = entity.origin
+        if not origin:
             return
-        self.generate_cypher_to_add_entity(entity.origin)
-        self.generate_cypher_to_add_relationship(entity, "has_origin", entity.origin)
-        self.process_tags(entity.origin)
+        self.generate_cypher_to_add_entity(origin)
+        self.generate_cypher_to_add_relationship(entity, "has_origin", origin)
+        if self.first_expansion(origin):
+            self.process_tags(origin)
 
     def process_terms(self, entity: Entity) -> None:
         """Generate cypher statements to create/merge an entity's term attributes."""
-        if not entity.terms:
+        terms = entity.terms
+        if not terms:
             return
-        for term in entity.terms.values():
+        for term in terms.values():
             self.generate_cypher_to_add_entity(term)
             if isinstance(entity, Concept):
                 self.generate_cypher_to_add_relationship(term, "represents", entity)
             else:
                 self.generate_cypher_to_add_relationship(entity, "has_term", term)
+            if not self.first_expansion(term):
+                continue
             self.process_tags(term)
             self.process_origin(term)
             self.process_concept(term)
 
     def process_concept(self, entity: Entity) -> None:
         """Generate cypher statements to create/merge an entity's concept attribute."""
-        if not entity.concept:
+        concept = entity.concept
+        if not concept:
             return
-        if not entity.concept.tags.get("mapping_source"):
-            entity.concept.tags["mapping_source"] = Tag(
-                {"key": "mapping_source", "value": self.model.handle},
-            )
-        self.generate_cypher_to_add_entity(entity.concept)
-        self.generate_cypher_to_add_relationship(entity, "has_concept", entity.concept)
-        self.process_tags(entity.concept)
-        self.process_terms(entity.concept)
+        if not concept.tags.get("mapping_source"):
+            concept.tags["mapping_source"] = Tag(self.mapping_source_attrs)
+        self.generate_cypher_to_add_entity(concept)
+        self.generate_cypher_to_add_relationship(entity, "has_concept", concept)
+        if not self.first_expansion(concept):
+            return
+        self.process_tags(concept)
+        self.process_terms(concept)
 
     def process_value_set(self, entity: Entity) -> None:
         """Generate cypher statements to merge an entity's value_set attribute."""
-        if not entity.value_set:
+        value_set = entity.value_set
+        if not value_set:
             return
-        if not entity.value_set.nanoid:
-            entity.value_set.nanoid = make_nanoid()
-        self.generate_cypher_to_add_entity(entity.value_set)
-        self.generate_cypher_to_add_relationship(
-            entity,
-            "has_value_set",
-            entity.value_set,
-        )
-        self.process_tags(entity.value_set)
-        self.process_origin(entity.value_set)
-        self.process_terms(entity.value_set)
+        if not value_set.nanoid:
+            value_set.nanoid = make_nanoid()
+        self.generate_cypher_to_add_entity(value_set)
+        self.generate_cypher_to_add_relationship(entity, "has_value_set", value_set)
+        if not self.first_expansion(value_set):
+            return
+        self.process_tags(value_set)
+        self.process_origin(value_set)
+        self.process_terms(value_set)
 
     def process_props(self, entity: Entity) -> None:
         """Generate cypher statements to create/merge an entity's props attribute."""
-        if not entity.props:
+        props = entity.props
+        if not props:
             return
-        for prop in entity.props.values():
+        for prop in props.values():
             if not prop.nanoid:
                 prop.nanoid = make_nanoid()
             if not prop._parent_handle:  # noqa: SLF001
@@ -223,10 +298,13 @@ class ModelToChangelogConverter:
         Does not process placeholder node/relationship/props.
         """
         logger.info("Processing terms-only model.")
-        prop_terms = [p.terms for p in self.model.props.values()]
-        flat_prop_terms = [v for d in prop_terms for v in d.values()]
-        for term in flat_prop_terms + list(self.model.terms.values()):
+        prop_terms = chain.from_iterable(
+            prop.terms.values() for prop in self.model.props.values()
+        )
+        for term in chain(prop_terms, self.model.terms.values()):
             self.generate_cypher_to_add_entity(term)
+            if not self.first_expansion(term):
+                continue
             self.process_tags(term)
             self.process_origin(term)
             self.process_concept(term)
@@ -290,21 +368,33 @@ class ModelToChangelogConverter:
             self.process_model_edges()
         else:
             self.process_terms_model()
+        self.add_batched_entity_statements()
 
         changeset_id = 1
         changelog = Changelog()
 
+        size = self.statements_per_changeset
         for stmts in self.cypher_stmts.values():
-            for stmt, rollback in zip(stmts["statements"], stmts["rollbacks"]):
-                # testing replacing poorly escaped quotes
-                str_stmt = str(stmt).replace("\\'", "'")
+            # entity and relationship statements are never mixed in a changeset
+            pairs = list(zip(stmts["statements"], stmts["rollbacks"]))
+            for i in range(0, len(pairs), size):
+                batch = pairs[i : i + size]
+                str_stmt = ";\n".join(str(stmt) for stmt, _ in batch)
                 changeset = Changeset(
                     id=str(changeset_id),
                     author=author,
                     change_type=CypherChange(text=str_stmt),
                 )
                 if self.add_rollback:
-                    changeset.set_rollback(Rollback(text=str(rollback)))
+                    # undo in reverse order; "empty" marks no-op rollbacks
+                    rollbacks = [
+                        str(rollback)
+                        for _, rollback in reversed(batch)
+                        if str(rollback) != "empty"
+                    ]
+                    changeset.set_rollback(
+                        Rollback(text=";\n".join(rollbacks) or "empty"),
+                    )
                 changelog.add_changeset(changeset)
                 changeset_id += 1
 
@@ -1,20 +1,65 @@
 import os
 import subprocess
-from time import sleep
+from datetime import UTC, datetime
 
 import pytest
 import requests
 
-wait = 25
+from tests.test_docker import DOCKER_IMAGE_TAG, DOCKERFILE_PATH
+
+# seconds to wait for a service to answer; covers neo4j's cold start
+wait = 60
+
+
+def image_is_current(tag, dockerfile):
+    """Check if a local image exists and was built after the Dockerfile changed."""
+    # imported here so runs without docker tests don't load the docker SDK
+    import docker
+
+    try:
+        image = docker.from_env().images.get(tag)
+    except docker.errors.DockerException:
+        return False
+    # Created has nanosecond precision, which strptime can't parse
+    created = datetime.strptime(image.attrs["Created"][:19], "%Y-%m-%dT%H:%M:%S")
+    return created.replace(tzinfo=UTC).timestamp() > dockerfile.stat().st_mtime
+
+
+def docker_available():
+    """Check if the Docker daemon answers a ping."""
+    import docker
+
+    try:
+        return docker.from_env(timeout=1).ping()
+    except (docker.errors.DockerException, requests.exceptions.RequestException):
+        return False
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip docker-marked tests up front if the Docker daemon is unreachable."""
+    docker_items = [item for item in items if item.get_closest_marker("docker")]
+    if not docker_items or docker_available():
+        return
+    skip_docker = pytest.mark.skip(reason="Docker daemon unavailable")
+    for item in docker_items:
+        item.add_marker(skip_docker)
 
 
 def is_responsive(url):
+    # requests' ConnectionError isn't the builtin, so catch its base class
     try:
-        response = requests.get(url)
-        if response.status_code == 200:
-            return True
-    except ConnectionError:
+        response = requests.get(url, timeout=1)
+    except requests.exceptions.RequestException:
         return False
+    return response.status_code == 200
+
+
+@pytest.fixture(scope="session")
+def docker_setup():
+    """Bring up compose services, rebuilding the worker image only if stale."""
+    if image_is_current(DOCKER_IMAGE_TAG, DOCKERFILE_PATH):
+        return ["up -d"]
+    return ["up --build -d"]
 
 
 @pytest.fixture(scope="session")
@@ -24,9 +69,8 @@ def mdb_versioned(docker_services, docker_ip):
     http_port = docker_services.port_for("mdb-versioned", 7474)
     bolt_url = f"bolt://{docker_ip}:{bolt_port}"
     http_url = f"http://{docker_ip}:{http_port}"
-    sleep(wait)
     docker_services.wait_until_responsive(
-        timeout=30.0,
+        timeout=wait,
         pause=0.1,
         check=lambda: is_responsive(http_url),
     )
@@ -38,9 +82,8 @@ def prefect_worker(docker_services, docker_ip):
     """Start a container with the prefect-worker image."""
     http_port = docker_services.port_for("prefect-worker", 7475)
     http_url = f"http://{docker_ip}:{http_port}"
-    sleep(wait)
     docker_services.wait_until_responsive(
-        timeout=30.0,
+        timeout=wait,
         pause=0.1,
         check=lambda: is_responsive(http_url),
     )
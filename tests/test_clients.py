@@ -1,13 +1,22 @@
 import copy
 import datetime
+import io
+import json
 import logging
+import pickle
 import zipfile
 
 import pytest
 import requests
 from requests.exceptions import HTTPError
 
-from bento_mdb_updates.clients import CADSRClient, NCItClient
+from bento_mdb_updates.clients import (
+    CADSRClient,
+    GitHubClient,
+    NCIM_CACHE_VERSION,
+    NCItClient,
+    get_last_sync_date,
+)
 from bento_mdb_updates.constants import NCIM_TSV_NAME
 from bento_mdb_updates.datatypes import AnnotationSpec
 from tests.test_utils import (
@@ -32,16 +41,36 @@ class FakeResponse:
         content=None,
         status_code=200,
         raise_json_error=False,
+        headers=None,
     ):
+        self.headers = headers or {}
+        self.encoding = None
         self.json_data = json_data
         self.text = text_data
+        if content is None and json_data is not None:
+            content = json.dumps(json_data).encode("utf-8")
+        if raise_json_error:
+            content = b"not json"
         self.content = content
         self.status_code = status_code
         self.raise_json_error = raise_json_error
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
     def json(self):
         return self.json_data
 
+    def iter_content(self, chunk_size=1):
+        for i in range(0, len(self.content), chunk_size):
+            yield self.content[i : i + chunk_size]
+
+    def iter_lines(self, decode_unicode=False):
+        yield from (self.text or "").splitlines()
+
     def raise_for_status(self):
         if not (200 <= self.status_code < 300):
             raise HTTPError(f"HTTP Error: {self.status_code}")
@@ -57,17 +86,24 @@ def fake_requests_get(monkeypatch):
         content=None,
         status_code=200,
         raise_json_error=False,
+        response_headers=None,
     ):
-        def fake_get(url, timeout=5, headers=None):
+        def fake_get(url, timeout=5, headers=None, stream=False):
             return FakeResponse(
                 json_data,
                 text_data,
                 content,
                 status_code,
                 raise_json_error,
+                response_headers,
             )
 
         monkeypatch.setattr(requests, "get", fake_get)
+        monkeypatch.setattr(
+            requests.Session,
+            "get",
+            lambda self, url, **kwargs: fake_get(url, **kwargs),
+        )
 
     return _set_fake_get
 
@@ -80,6 +116,15 @@ def mock_ncit_client():
     return client
 
 
+def test_get_last_sync_date_reloads_changed_file(tmp_path) -> None:
+    yaml_path = tmp_path / "sync_status.yml"
+    yaml_path.write_text("NCIt:\n  last_updated: '202501'\n  date_format: '%Y%m'\n")
+    assert_equal(get_last_sync_date("NCIt", yaml_path).strftime("%Y%m"), "202501")
+    assert_equal(get_last_sync_date("NCIt", yaml_path).strftime("%Y%m"), "202501")
+    yaml_path.write_text("NCIt:\n  last_updated: '20250301'\n  date_format: '%Y%m%d'\n")
+    assert_equal(get_last_sync_date("NCIt", yaml_path).strftime("%Y%m"), "202503")
+
+
 class TestCADSRClient:
     """Tests for CADSRClient."""
 
@@ -172,6 +217,32 @@ class TestCADSRClient:
         actual = self.client.fetch_cde_valueset("11524549", "1")
         assert_equal(actual, [])
 
+    def test_fetch_cde_valueset_not_modified(self, fake_requests_get, tmp_path) -> None:
+        """Test that cached value set is reused when caDSR returns 304."""
+        cache_file = tmp_path / "cadsr_cache.json"
+        client = CADSRClient(cache_file=cache_file)
+        fake_requests_get(self.SAMPLE_RESPONSE, response_headers={"ETag": '"abc"'})
+        expected = client.fetch_cde_valueset("11524549", "1")
+        client.save_valueset_cache()
+
+        client = CADSRClient(cache_file=cache_file)
+        fake_requests_get(status_code=304)
+        actual = client.fetch_cde_valueset("11524549", "1")
+        assert_equal(actual, expected)
+
+    def test_fetch_cde_valueset_fresh_cache(self, fake_requests_get, tmp_path) -> None:
+        """Test that value sets cached within the TTL are served without HTTP."""
+        cache_file = tmp_path / "cadsr_cache.json"
+        client = CADSRClient(cache_file=cache_file, cache_ttl=3600)
+        fake_requests_get(self.SAMPLE_RESPONSE)
+        expected = client.fetch_cde_valueset("11524549", "1")
+        client.save_valueset_cache()
+
+        client = CADSRClient(cache_file=cache_file, cache_ttl=3600)
+        fake_requests_get(status_code=500)
+        actual = client.fetch_cde_valueset("11524549", "1")
+        assert_equal(actual, expected)
+
     def test_check_cdes_against_mdb_no_updates(self, monkeypatch) -> None:
         client = CADSRClient()
         monkeypatch.setattr(
@@ -214,7 +285,9 @@ class TestCADSRClient:
             "fetch_cde_valueset",
             lambda cde_id, cde_version: test_response_new_pv,
         )
-        annotations = client.check_cdes_against_mdb([TEST_MDB_CDE_SPEC])
+        annotations = client.check_cdes_against_mdb(
+            [TEST_MDB_CDE_SPEC, TEST_MDB_CDE_SPEC],
+        )
         expected_annotations = [
             AnnotationSpec(
                 entity={},
@@ -317,6 +390,65 @@ class TestNCItClient:
         with pytest.raises(zipfile.BadZipFile):
             mock_ncit_client.download_and_extract_tsv()
 
+    def test_load_ncim_tsv_to_dict_uses_cache(self, mock_ncit_client, tmp_path) -> None:
+        tsv_path = tmp_path / NCIM_TSV_NAME
+        tsv_path.write_text(TEST_NCIM_MAPPING_TSV, encoding="utf-8")
+        actual = mock_ncit_client.load_ncim_tsv_to_dict(tsv_path)
+        assert_equal(actual, TEST_NCIM_MAPPING)
+        assert tsv_path.with_suffix(".pkl").exists()
+        actual = mock_ncit_client.load_ncim_tsv_to_dict(tsv_path)
+        assert_equal(actual, TEST_NCIM_MAPPING)
+        # stale cache is ignored once the TSV changes
+        tsv_path.write_text(TEST_NCIM_MAPPING_TSV.split("\n", 1)[0], encoding="utf-8")
+        actual = mock_ncit_client.load_ncim_tsv_to_dict(tsv_path)
+        assert_equal(actual, {})
+
+    @pytest.mark.parametrize(
+        "payload",
+        [
+            ["not", "a", "dict"],
+            {"signature": (NCIM_CACHE_VERSION - 1,), "data": {"C0": []}},
+        ],
+        ids=["non_dict", "old_version"],
+    )
+    def test_load_ncim_tsv_to_dict_ignores_bad_cache(
+        self,
+        mock_ncit_client,
+        tmp_path,
+        payload,
+    ) -> None:
+        tsv_path = tmp_path / NCIM_TSV_NAME
+        tsv_path.write_text(TEST_NCIM_MAPPING_TSV, encoding="utf-8")
+        cache_path = tsv_path.with_suffix(".pkl")
+        if isinstance(payload, dict):
+            stat = tsv_path.stat()
+            signature = (*payload["signature"], stat.st_mtime_ns, stat.st_size)
+            payload = {**payload, "signature": signature}
+        cache_path.write_bytes(pickle.dumps(payload))
+        actual = mock_ncit_client.load_ncim_tsv_to_dict(tsv_path)
+        assert_equal(actual, TEST_NCIM_MAPPING)
+
+    def test_load_ncim_tsv_to_dict_literal_quotes(self, mock_ncit_client) -> None:
+        header = TEST_NCIM_MAPPING_TSV.split("\n", 1)[0]
+        tsv = (
+            f"{header}\n"
+            'C1\tA\tC1\tA\tX1\t"Quoted\tSRC\t1\tPT\n'
+            'C2\tB\tC2\tB\tX2\tTerm"\tSRC\t1\tPT\n'
+        )
+        actual = mock_ncit_client.load_ncim_tsv_to_dict(io.BytesIO(tsv.encode()))
+        assert_equal(actual["C1"][0]["value"], '"Quoted')
+        assert_equal(actual["C2"][0]["value"], 'Term"')
+
+    def test_load_ncim_tsv_to_dict_duplicate_rows(self, mock_ncit_client) -> None:
+        header = TEST_NCIM_MAPPING_TSV.split("\n", 1)[0]
+        tsv = (
+            f"{header}\n"
+            "C1\tA\tC1\tA\tX1\tTerm\tSRC\t1\tPT\n"
+            "C1\tA\tC1\tB\tX1\tTerm\tSRC\t1\tSY\n"
+        )
+        actual = mock_ncit_client.load_ncim_tsv_to_dict(io.BytesIO(tsv.encode()))
+        assert_equal(len(actual["C1"]), 1)
+
     def test_ncit_for_updated_mappings_update(
         self,
         monkeypatch,
@@ -390,3 +522,26 @@ class TestNCItClient:
             (x["model"], x["version"]) for x in TEST_MDB_CDE_SPEC["models"]
         }
         assert_equal(annotations, expected_annotations)
+
+
+class TestGitHubClient:
+    def test_get_repo_tags_follows_pagination(self, monkeypatch) -> None:
+        client = GitHubClient(github_token="token")
+        next_url = f"{client.BASE_URL}/repos/org/repo/tags?per_page=100&page=2"
+        pages = {
+            f"{client.BASE_URL}/repos/org/repo/tags": (
+                [{"name": "1.0.0"}, {"name": "1.1.0"}],
+                {"next": {"url": next_url}},
+            ),
+            next_url: ([{"name": "0.9.0"}], {}),
+        }
+
+        def fake_get(url, params=None, timeout=None):
+            json_data, links = pages[url]
+            response = FakeResponse(json_data)
+            response.links = links
+            return response
+
+        monkeypatch.setattr(client.session, "get", fake_get)
+        actual = client.get_repo_tags_batch(["org/repo", "org/repo"])
+        assert_equal(actual, {"org/repo": ["1.0.0", "1.1.0", "0.9.0"]})
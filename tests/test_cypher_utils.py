@@ -3,10 +3,12 @@
 from bento_meta.objects import Node, Property, Term
 
 from bento_mdb_updates.cypher_utils import (
+    create_entities_batch_cypher_stmt,
     create_entity_cypher_stmt,
     create_relationship_cypher_stmt,
     escape_quotes_in_attr,
     generate_cypher_to_link_term_synonyms,
+    periodic_iterate_stmt,
 )
 from tests.test_utils import assert_equal
 
@@ -16,8 +18,12 @@ def test_escape_quotes_in_attr() -> None:
         {"handle": "Quote's Handle", "desc": """quote's quote\'s "quotes\""""},
     )
     escape_quotes_in_attr(prop)
-    assert prop.handle == r"""Quote\'s Handle"""
-    assert prop.desc == r"""quote\'s quote\'s \"quotes\""""
+    # ' is escaped by minicypher when rendered, so only " stays escaped here
+    assert prop.handle == r"""Quote's Handle"""
+    assert prop.desc == r"""quote's quote's \"quotes\""""
+    stmt = str(create_entity_cypher_stmt(prop)[0])
+    assert_equal(stmt.count("\\'"), 3)
+    assert "\\\\'" not in stmt
 
 
 class TestCreateEntityCypherStmt:
@@ -53,6 +59,70 @@ class TestCreateEntityCypherStmt:
         assert_equal(actual, expected)
 
 
+class TestCreateEntitiesBatchCypherStmt:
+    """Tests for create_entities_batch_cypher_stmt."""
+
+    def test_create_nodes_batch_cypher(self) -> None:
+        nodes = [Node({"handle": "node_1"}), Node({"handle": "node_2"})]
+        stmt, rollback = create_entities_batch_cypher_stmt(nodes)[0]
+        unwind = "UNWIND [{handle:'node_1'},{handle:'node_2'}] AS row"
+        assert_equal(str(stmt), f"{unwind} CREATE (n0:node {{handle:row.handle}})")
+        assert_equal(
+            str(rollback),
+            f"{unwind} MATCH (n0:node {{handle:row.handle}}) DETACH DELETE n0",
+        )
+
+    def test_merge_terms_batch_cypher(self) -> None:
+        terms = [Term({"value": "term_1"}), Term({"value": "term_2"})]
+        for term in terms:
+            term._commit = "TEST_COMMIT"
+        stmts = create_entities_batch_cypher_stmt(terms, batch_size=1)
+        actual = [str(stmt) for stmt, _ in stmts]
+        expected = [
+            f"UNWIND [{{value:'{value}',_commit:'TEST_COMMIT'}}] AS row "
+            "MERGE (n0:term {value:row.value}) "
+            "ON CREATE SET n0._commit = row._commit"
+            for value in ("term_1", "term_2")
+        ]
+        assert_equal(actual, expected)
+
+    def test_create_nodes_periodic_iterate_cypher(self) -> None:
+        nodes = [Node({"handle": "node_1"}), Node({"handle": "node_2"})]
+        stmt, rollback = create_entities_batch_cypher_stmt(
+            nodes,
+            iterate_batch_size=500,
+        )[0]
+        rows = "{handle:'node_1'},{handle:'node_2'}"
+        call = 'CALL apoc.periodic.iterate("UNWIND $rows AS row RETURN row", '
+        config = f"{{batchSize:500, params:{{rows:[{rows}]}}}})"
+        validate = (
+            "YIELD failedOperations, errorMessages "
+            "CALL apoc.util.validate(failedOperations > 0, "
+            "'periodic.iterate failed: %s', [errorMessages])"
+        )
+        assert_equal(
+            str(stmt),
+            f'{call}"CREATE (n0:node {{handle:row.handle}})", {config} {validate}',
+        )
+        assert_equal(
+            str(rollback),
+            f'{call}"MATCH (n0:node {{handle:row.handle}}) DETACH DELETE n0", '
+            f"{config} {validate}",
+        )
+
+
+def test_periodic_iterate_stmt_fails_on_inner_batch_errors() -> None:
+    actual = periodic_iterate_stmt(["{handle:'node_1'}"], "CREATE (n0:node)", 10)
+    expected = (
+        'CALL apoc.periodic.iterate("UNWIND $rows AS row RETURN row", '
+        '"CREATE (n0:node)", {batchSize:10, params:{rows:[{handle:\'node_1\'}]}}) '
+        "YIELD failedOperations, errorMessages "
+        "CALL apoc.util.validate(failedOperations > 0, "
+        "'periodic.iterate failed: %s', [errorMessages])"
+    )
+    assert_equal(actual, expected)
+
+
 class TestCreateRelationshipCypherStmt:
     """Tests for create_relationship_cypher_stmt."""
 
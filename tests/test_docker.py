@@ -2,6 +2,10 @@
 
 from pathlib import Path
 
+import pytest
+
+pytestmark = pytest.mark.docker
+
 PROJECT_ROOT = Path(__file__).parent.parent
 DOCKERFILE_PATH = PROJECT_ROOT / "Dockerfile"
 DOCKER_IMAGE_TAG = "mdb-update-test:latest"
@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import pytest
+from neo4j.exceptions import ServiceUnavailable
+
+from bento_mdb_updates import mdb_utils
+from bento_mdb_updates.mdb_utils import init_mdb_connection, refresh_mdb_models
+from tests.test_utils import assert_equal
+
+TEST_MDB_ID = "fnl-mdb-dev"
+TEST_CREDENTIALS = ("bolt://localhost:7687", "neo4j", "password")
+
+
+class FakeMDB:
+    """Fake MDB that reads model info from a shared, mutable 'database'."""
+
+    def __init__(self, db: list[dict]) -> None:
+        self.uri = TEST_CREDENTIALS[0]
+        self.driver = object()
+        self.db = db
+        self.closed = False
+        self.models = {}
+        self.latest_version = {}
+        refresh_mdb_models(self)  # type: ignore reportArgumentType
+
+    def get_model_info(self) -> list[dict]:
+        if self.closed:
+            msg = "driver closed"
+            raise ServiceUnavailable(msg)
+        return list(self.db)
+
+    def close(self) -> None:
+        self.closed = True
+
+
+@pytest.fixture
+def fake_mdb_db(monkeypatch) -> tuple[list[dict], list[FakeMDB]]:
+    """Stub credentials and connect_mdb; return the fake DB and MDBs created."""
+    db: list[dict] = []
+    created: list[FakeMDB] = []
+
+    def fake_connect_mdb(uri, user, password, *, writeable=False):
+        mdb = FakeMDB(db)
+        created.append(mdb)
+        return mdb
+
+    monkeypatch.setattr(mdb_utils, "_MDB_CONNECTIONS", {})
+    monkeypatch.setattr(mdb_utils, "get_mdb_credentials", lambda _: TEST_CREDENTIALS)
+    monkeypatch.setattr(mdb_utils, "connect_mdb", fake_connect_mdb)
+    return db, created
+
+
+class TestInitMDBConnection:
+    """Tests for init_mdb_connection connection reuse."""
+
+    def test_reuses_cached_connection(self, fake_mdb_db) -> None:
+        db, created = fake_mdb_db
+        db.append({"handle": "TEST", "version": "1.0.0", "is_latest_version": True})
+        first = init_mdb_connection(TEST_MDB_ID)
+        second = init_mdb_connection(TEST_MDB_ID)
+        assert second is first
+        assert len(created) == 1
+
+    def test_reused_connection_sees_loaded_models(self, fake_mdb_db) -> None:
+        db, created = fake_mdb_db
+        mdb = init_mdb_connection(TEST_MDB_ID, allow_empty=True)
+        assert_equal(mdb.models, {})
+        db.append({"handle": "TEST", "version": "1.0.0", "is_latest_version": True})
+        reused = init_mdb_connection(TEST_MDB_ID)
+        assert reused is mdb
+        assert len(created) == 1
+        assert_equal(reused.models, {"TEST": ["1.0.0"]})
+        assert_equal(reused.latest_version, {"TEST": "1.0.0"})
+
+    def test_reused_connection_sees_cleared_models(self, fake_mdb_db) -> None:
+        db, created = fake_mdb_db
+        db.append({"handle": "TEST", "version": "1.0.0", "is_latest_version": True})
+        mdb = init_mdb_connection(TEST_MDB_ID, writeable=True, allow_empty=True)
+        db.clear()
+        with pytest.raises(RuntimeError):
+            init_mdb_connection(TEST_MDB_ID, writeable=True)
+        # the first caller's driver is still open and cached
+        assert not mdb.closed
+        assert len(created) == 1
+        assert init_mdb_connection(TEST_MDB_ID, writeable=True, allow_empty=True) is mdb
+
+    def test_closes_new_connection_that_fails_verify(self, fake_mdb_db) -> None:
+        _, created = fake_mdb_db
+        with pytest.raises(RuntimeError):
+            init_mdb_connection(TEST_MDB_ID)
+        assert len(created) == 1
+        assert created[0].closed
+        assert not mdb_utils._MDB_CONNECTIONS  # noqa: SLF001
+
+    def test_reconnects_and_closes_broken_connection(self, fake_mdb_db) -> None:
+        db, created = fake_mdb_db
+        db.append({"handle": "TEST", "version": "1.0.0", "is_latest_version": True})
+        mdb = init_mdb_connection(TEST_MDB_ID)
+        mdb.closed = True  # driver gone, e.g. server restarted
+        reconnected = init_mdb_connection(TEST_MDB_ID)
+        assert reconnected is not mdb
+        assert len(created) == 2
+        assert_equal(reconnected.models, {"TEST": ["1.0.0"]})
+        assert mdb_utils._MDB_CONNECTIONS == {  # noqa: SLF001
+            (*TEST_CREDENTIALS[:2], False): reconnected,
+        }
+
+    def test_connects_without_holding_lock(self, fake_mdb_db, monkeypatch) -> None:
+        db, created = fake_mdb_db
+        db.append({"handle": "TEST", "version": "1.0.0", "is_latest_version": True})
+        lock_held = []
+
+        def connect_mdb(uri, user, password, *, writeable=False):
+            lock_held.append(mdb_utils._MDB_CONNECTIONS_LOCK.locked())  # noqa: SLF001
+            mdb = FakeMDB(db)
+            created.append(mdb)
+            return mdb
+
+        monkeypatch.setattr(mdb_utils, "connect_mdb", connect_mdb)
+        init_mdb_connection(TEST_MDB_ID)
+        assert_equal(lock_held, [False])
+
+    def test_keeps_connection_cached_by_concurrent_caller(
+        self,
+        fake_mdb_db,
+        monkeypatch,
+    ) -> None:
+        db, created = fake_mdb_db
+        db.append({"handle": "TEST", "version": "1.0.0", "is_latest_version": True})
+        other = FakeMDB(db)
+
+        def connect_mdb(uri, user, password, *, writeable=False):
+            # another thread caches its connection while this one connects
+            mdb_utils._MDB_CONNECTIONS[(uri, user, writeable)] = other  # noqa: SLF001
+            mdb = FakeMDB(db)
+            created.append(mdb)
+            return mdb
+
+        monkeypatch.setattr(mdb_utils, "connect_mdb", connect_mdb)
+        assert init_mdb_connection(TEST_MDB_ID) is other
+        assert created[0].closed
+        assert not other.closed
+
+
+class TestRefreshMDBModels:
+    """Tests for refresh_mdb_models."""
+
+    def test_refresh_mdb_models_latest_versions(self) -> None:
+        db = [
+            {"handle": "A", "version": "1.0.0", "is_latest_version": False},
+            {"handle": "A", "version": "1.1.0", "is_latest_version": True},
+            {"handle": "B", "version": "2.0.0"},
+            {"handle": "C", "version": "0.1.0"},
+            {"handle": "C", "version": "0.2.0"},
+        ]
+        mdb = FakeMDB(db)
+        assert_equal(
+            mdb.models,
+            {"A": ["1.0.0", "1.1.0"], "B": ["2.0.0"], "C": ["0.1.0", "0.2.0"]},
+        )
+        assert_equal(mdb.latest_version, {"A": "1.1.0", "B": "2.0.0", "C": None})
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
-import copy
+import io
+from dataclasses import dataclass
 from pathlib import Path
+from typing import TYPE_CHECKING
 
+import orjson
 import pytest
 import yaml
 from bento_mdf.mdf import MDFReader
@@ -10,21 +13,23 @@ from bento_mdf.mdf import MDFReader
 from bento_mdb_updates.datatypes import ModelSpec
 from bento_mdb_updates.model_cdes import (
     compare_model_specs_to_mdb,
+    dump_model_cde_spec_to_json,
     get_yaml_files_from_spec,
     load_model_specs_from_yaml,
     make_model_cde_spec,
-    process_mdb_cdes,
 )
 from tests.test_utils import (
     TEST_MAKE_MODEL_CDE_SPEC_BASE,
     TEST_MDB_CDE_SPEC,
-    TEST_MDB_CDE_SPEC_RAW,
     TEST_MODEL_SPEC,
     TEST_MODEL_SPEC_INVALID_YML,
     TEST_MODEL_SPEC_YML,
     assert_equal,
 )
 
+if TYPE_CHECKING:
+    from bento_meta.model import Model
+
 
 class TestLoadModelSpecsFromYaml:
     """Tests for load_model_specs_from_yaml."""
@@ -36,12 +41,15 @@ class TestLoadModelSpecsFromYaml:
         actual = load_model_specs_from_yaml(valid_yaml)
         assert_equal(actual, TEST_MODEL_SPEC)
 
-    def test_load_model_specs_from_yaml_invalid(self, tmp_path) -> None:
+    def test_load_model_specs_from_yaml_stream(self) -> None:
+        """Test loading valid model specs yaml from a text stream."""
+        actual = load_model_specs_from_yaml(io.StringIO(TEST_MODEL_SPEC_YML))
+        assert_equal(actual, TEST_MODEL_SPEC)
+
+    def test_load_model_specs_from_yaml_invalid(self) -> None:
         """Test loading invalid model specs yaml."""
-        invalid_yaml = Path(tmp_path / "invalid.yml")
-        invalid_yaml.write_text(TEST_MODEL_SPEC_INVALID_YML, encoding="utf-8")
         with pytest.raises(yaml.YAMLError):
-            load_model_specs_from_yaml(invalid_yaml)
+            load_model_specs_from_yaml(io.StringIO(TEST_MODEL_SPEC_INVALID_YML))
 
     def test_load_model_specs_from_yaml_missing(self, tmp_path) -> None:
         """Test loading missing model specs yaml."""
@@ -53,37 +61,39 @@ class TestLoadModelSpecsFromYaml:
 class TestGetYamlFilesFromSpec:
     """Tests for get_yaml_files_from_spec."""
 
-    def test_get_yaml_files_from_spec(self) -> None:
+    @pytest.mark.parametrize(
+        ("test_model", "test_version", "base_url"),
+        [
+            (
+                "TCDS",
+                "1.0.0",
+                "https://raw.githubusercontent.com/"
+                "CBIIT/test-cds-model/1.0.0-release/model-desc/",
+            ),
+            (
+                "TCCDI",
+                None,
+                "https://raw.githubusercontent.com/"
+                "CBIIT/test-ccdi-model/2.0.0/model-desc/",
+            ),
+            (
+                "TCCDI",
+                "0.1.0",
+                "https://raw.githubusercontent.com/"
+                "CBIIT/test-ccdi-model/0.1.0/model-desc/",
+            ),
+        ],
+        ids=["tagged", "latest", "no_tag"],
+    )
+    def test_get_yaml_files_from_spec(
+        self,
+        test_model: str,
+        test_version: str | None,
+        base_url: str,
+    ) -> None:
         """Test getting YAML files from model spec."""
-        test_model, test_version = "TCDS", "1.0.0"
         test_spec = TEST_MODEL_SPEC[test_model]
         actual = get_yaml_files_from_spec(test_spec, test_model, test_version)
-        base_url = (
-            "https://raw.githubusercontent.com/"
-            "CBIIT/test-cds-model/1.0.0-release/model-desc/"
-        )
-        expected = [base_url + str(f) for f in test_spec["mdf_files"]]
-        assert_equal(actual, expected)
-
-    def test_get_yaml_files_from_spec_latest(self) -> None:
-        """Test getting YAML files from model spec for latest version."""
-        test_model = "TCCDI"
-        test_spec = TEST_MODEL_SPEC[test_model]
-        actual = get_yaml_files_from_spec(test_spec, test_model)
-        base_url = (
-            "https://raw.githubusercontent.com/CBIIT/test-ccdi-model/2.0.0/model-desc/"
-        )
-        expected = [base_url + str(f) for f in test_spec["mdf_files"]]
-        assert_equal(actual, expected)
-
-    def test_get_yaml_files_from_spec_no_tag(self) -> None:
-        """Test getting YAML files from model spec without a tag."""
-        test_model = "TCCDI"
-        test_spec = TEST_MODEL_SPEC[test_model]
-        actual = get_yaml_files_from_spec(test_spec, test_model, "0.1.0")
-        base_url = (
-            "https://raw.githubusercontent.com/CBIIT/test-ccdi-model/0.1.0/model-desc/"
-        )
         expected = [base_url + str(f) for f in test_spec["mdf_files"]]
         assert_equal(actual, expected)
 
@@ -114,18 +124,28 @@ class TestGetYamlFilesFromSpec:
         assert_equal(actual, expected)
 
 
+@pytest.fixture(scope="session")
+def mdf_model() -> Model:
+    """Model from the CDE sample MDF, parsed once per session."""
+    return MDFReader(Path(__file__).parent / "samples" / "test_mdf_cdes.yml").model
+
+
 class TestModelCDESpec:
     """Tests for model CDE spec."""
 
-    TEST_MDF = Path(__file__).parent / "samples" / "test_mdf_cdes.yml"
-    mdf = MDFReader(TEST_MDF)
-    model = mdf.model
-
-    def test_make_model_cde_spec(self) -> None:
+    def test_make_model_cde_spec(self, mdf_model: Model) -> None:
         """Test making model CDE spec."""
-        actual = make_model_cde_spec(self.model)
+        actual = make_model_cde_spec(mdf_model)
         assert_equal(actual, TEST_MAKE_MODEL_CDE_SPEC_BASE)
 
+    def test_dump_model_cde_spec_to_json(self, tmp_path) -> None:
+        """Test streamed JSON dump round-trips the model CDE spec."""
+        json_file = tmp_path / "spec" / "test_cdes.json"
+        dump_model_cde_spec_to_json(TEST_MAKE_MODEL_CDE_SPEC_BASE, json_file)
+        actual = orjson.loads(json_file.read_bytes())
+        expected = orjson.loads(orjson.dumps(TEST_MAKE_MODEL_CDE_SPEC_BASE))
+        assert actual == expected
+
     def test_add_ncit_synonyms_to_model_cde_spec(self) -> None:
         """Test adding NCIt synonyms to model CDE spec."""
 
@@ -136,9 +156,9 @@ class TestModelCDESpec:
 class TestCompareModelSpec:
     """Tests for model spec."""
 
+    @dataclass(slots=True)
     class MockMDB:
-        def __init__(self, models: dict[str, list[str]]) -> None:
-            self.models = models
+        models: dict[str, list[str]]
 
     TEST_MDB_MODELS_YAML = Path(__file__).parent / "samples" / "test_mdb_models.yml"
 
@@ -196,9 +216,3 @@ class TestCompareModelSpec:
         )
         nightly_expected = {"TEST2": ["1.1.0-abcd123"]}
         assert_equal(nightly_actual, nightly_expected)
-
-
-def test_process_mdb_cdes() -> None:
-    raw_mdb_cdes = copy.deepcopy(TEST_MDB_CDE_SPEC_RAW)
-    process_mdb_cdes([raw_mdb_cdes])  # type: ignore reportArgumentType
-    assert_equal(raw_mdb_cdes, TEST_MDB_CDE_SPEC)
@@ -4,7 +4,7 @@ from pathlib import Path
 
 from bento_mdf.mdf import MDF
 from bento_meta.model import Model
-from bento_meta.objects import Node, Property
+from bento_meta.objects import Concept, Node, Property, Term
 
 from bento_mdb_updates.model_cypher import ModelToChangelogConverter
 from tests.test_utils import assert_equal, remove_nanoids_from_str
@@ -160,12 +160,6 @@ class TestMakeModelChangelog:
             "_commit:'_COMMIT_123'}), "
             "(n1:concept {nanoid:'',_commit:'_COMMIT_123'}) "
             "MERGE (n0)-[r0:has_concept]->(n1)",
-            "MATCH (n0:concept {nanoid:'',_commit:'_COMMIT_123'}), "
-            "(n1:tag {key:'mapping_source',value:'TEST',nanoid:''}) "
-            "MERGE (n0)-[r0:has_tag]->(n1)",
-            "MATCH (n0:term {handle:'file_type',value:'File Type',"
-            "origin_name:'caDSR'}), (n1:concept {nanoid:'',_commit:'_COMMIT_123'}) "
-            "MERGE (n0)-[r0:represents]->(n1)",
             "MATCH (n0:property {handle:'file_type',model:'TEST',nanoid:'',"
             "version:'1.2.3',value_domain:'value_set',is_required:False,"
             "is_key:False,is_nullable:False,is_strict:True,"
@@ -179,3 +173,62 @@ class TestMakeModelChangelog:
             "origin_name:'TEST'}) MERGE (n0)-[r0:has_term]->(n1)",
         ]
         assert_equal(actual, expected)
+
+    def test_make_model_changelog_batched_entities(self) -> None:
+        """Test entities are created by one UNWIND statement per label in batch mode."""
+        model = Model(handle=MODEL_HDL, version="1.0.0")
+        node = Node({"handle": "sample", "model": MODEL_HDL})
+        prop_1 = Property({"handle": "id", "model": MODEL_HDL, "desc": "Sample's id"})
+        prop_2 = Property({"handle": "type", "model": MODEL_HDL, "desc": "type"})
+        model.add_node(node)
+        model.add_prop(node, prop_1)
+        model.add_prop(node, prop_2)
+        converter = ModelToChangelogConverter(
+            model=model,
+            add_rollback=False,
+            batch_size=1000,
+        )
+        changelog = converter.convert_model_to_changelog(author=AUTHOR)
+        texts = [x.change_type.text for x in changelog.subelements]
+        unwind_stmts = [t for t in texts if t.startswith("UNWIND")]
+        # one statement each for model, node, and properties
+        assert_equal(len(unwind_stmts), 3)
+        prop_stmt = next(t for t in unwind_stmts if ":property" in t)
+        assert "desc:'Sample\\'s id'" in prop_stmt
+        assert prop_stmt.count("handle:'") == 2
+        # relationships still one statement each: node-has_property-prop x2
+        assert_equal(len(texts), len(unwind_stmts) + 2)
+
+    def test_shared_concept_expanded_once(self) -> None:
+        """Test concept shared by props is linked to each but its terms only once."""
+        model = Model(handle=MODEL_HDL, version="1.0.0")
+        node = Node({"handle": "sample", "model": MODEL_HDL})
+        term = Term({"value": "Sample ID", "origin_name": "caDSR", "origin_id": "1"})
+        concept = Concept({"nanoid": "c1"})
+        concept.terms = {("Sample ID", "caDSR"): term}
+        model.add_node(node)
+        for handle in ("id", "other_id"):
+            prop = Property({"handle": handle, "model": MODEL_HDL})
+            prop.concept = concept
+            model.add_prop(node, prop)
+        converter = ModelToChangelogConverter(model=model, add_rollback=False)
+        changelog = converter.convert_model_to_changelog(author=AUTHOR)
+        texts = [x.change_type.text for x in changelog.subelements]
+        assert_equal(sum("has_concept" in t for t in texts), 2)
+        assert_equal(sum("has_tag" in t for t in texts), 1)
+        assert_equal(sum("represents" in t for t in texts), 1)
+
+    def test_make_model_changelog_statements_per_changeset(self) -> None:
+        """Test statements of the same type are grouped into changesets."""
+        model = Model(handle=MODEL_HDL, version="1.0.0")
+        node = Node({"handle": "sample", "model": MODEL_HDL})
+        model.add_node(node)
+        for handle in ("id", "type", "size"):
+            model.add_prop(node, Property({"handle": handle, "model": MODEL_HDL}))
+        converter = ModelToChangelogConverter(model=model, statements_per_changeset=3)
+        changelog = converter.convert_model_to_changelog(author=AUTHOR)
+        # 5 entity statements -> 2 changesets; 3 relationship statements -> 1
+        texts = [x.change_type.text for x in changelog.subelements]
+        assert_equal([t.count(";\n") + 1 for t in texts], [3, 2, 3])
+        assert texts[0].startswith("CREATE (n0:model")
+        assert all(t.startswith("MATCH") for t in texts[2].split(";\n"))
@@ -14,28 +14,28 @@ from bento_mdb_updates.datatypes import (
     ModelSpec,
 )
 
+NANOID_PATTERN = re.compile(r"nanoid:'[^']*'")
+
 
 def remove_nanoids_from_str(statement: str) -> str:
     """Remove values for 'nanoid' attr from string if present."""
-    return re.sub(r"nanoid:'[^']*'", "nanoid:''", statement)
+    return NANOID_PATTERN.sub("nanoid:''", statement)
 
 
 def assert_equal(actual: Any, expected: Any) -> None:  # noqa: ANN401
     """
     Compare actual and expected results.
 
-    Print both values in case of failure for better debugging.
+    Relies on pytest's assertion rewriting to show a structural diff on failure.
     """
-    if actual != expected:
-        print("\n=== ACTUAL ===\n", actual)
-        print("\n=== EXPECTED ===\n", expected)
     assert actual == expected
 
 
 def create_mock_zip(mock_name: str, mock_data: str) -> bytes:
     """Create an in-memory ZIP file containing the mock TSV data."""
     zip_buffer = io.BytesIO()
-    with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED) as zip_file:
+    # stored, not deflated: mock archives are tiny and never kept
+    with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_STORED) as zip_file:
         zip_file.writestr(mock_name, mock_data)
     zip_buffer.seek(0)  # Reset buffer position
     return zip_buffer.getvalue()
@@ -182,100 +182,6 @@ TEST_MODEL_CDE_SPEC_NO_ANNOTATIONS = ModelCDESpec(
     annotations=[],
 )
 
-TEST_MDB_CDE_SPEC_RAW = {
-    "CDECode": "6142527",
-    "CDEVersion": "1.00",
-    "CDEFullName": "ploidy",
-    "CDEOrigin": "caDSR",
-    "models": [
-        {"property": "molecular_test.ploidy", "model": "CCDI", "version": "2.0.0"},
-        {"property": "molecular_test.ploidy", "model": "CCDI", "version": "2.1.0"},
-        {"property": "molecular_test.ploidy", "model": "C3DC", "version": "1.2.3"},
-    ],
-    "permissibleValues": [
-        {
-            "origin_version": "1",
-            "synonyms": [
-                {
-                    "origin_version": "20.05a",
-                    "origin_id": "C43234",
-                    "value": "Not Reported",
-                    "origin_name": "NCIt",
-                },
-                {
-                    "origin_version": "1",
-                    "origin_id": "C43234",
-                    "value": "Not Reported",
-                    "origin_name": "NCIt",
-                },
-            ],
-            "origin_id": "2572578",
-            "origin_definition": "Not provided or available.",
-            "value": "Not Reported",
-            "origin_name": "caDSR",
-        },
-        {
-            "origin_version": "1",
-            "synonyms": [
-                {
-                    "origin_version": "2024_03_01",
-                    "origin_id": "C123456",
-                    "value": "Unknown (qualifier value)",
-                    "origin_name": "NCIt",
-                },
-                {
-                    "origin_version": None,
-                    "origin_id": "C17998",
-                    "value": "Unknown",
-                    "origin_name": "NCIt",
-                },
-            ],
-            "origin_id": "2565695",
-            "origin_definition": "Not known, not observed, not recorded, or refused.",
-            "value": "Unknown",
-            "origin_name": "caDSR",
-        },
-        {
-            "origin_version": "1",
-            "synonyms": [],
-            "origin_id": "2558889",
-            "origin_definition": "A chromosomal abnormality in which the chromosomal number is less than the normal diploid number.",
-            "value": "Hypodiploid",
-            "origin_name": "caDSR",
-        },
-        {
-            "origin_version": "1",
-            "synonyms": [
-                {
-                    "origin_version": "2_77",
-                    "origin_id": "LA30219-2",
-                    "value": "Hyperdiploid",
-                    "origin_name": "LNC",
-                },
-            ],
-            "origin_id": "2558886",
-            "origin_definition": "A chromosomal abnormality in which the chromosomal number is greater than the normal diploid number.",
-            "value": "Hyperdiploid",
-            "origin_name": "caDSR",
-        },
-        {
-            "origin_version": "1",
-            "synonyms": [
-                {
-                    "origin_version": "20.10d",
-                    "origin_id": "C118941",
-                    "value": "Diploidy",
-                    "origin_name": "NCIt",
-                },
-            ],
-            "origin_id": "2558626",
-            "origin_definition": "Having two sets of homologous chromosomes.",
-            "value": "Diploid",
-            "origin_name": "caDSR",
-        },
-    ],
-}
-
 TEST_MDB_CDE_SPEC = MDBCDESpec(
     CDECode="6142527",
     CDEVersion="1.00",